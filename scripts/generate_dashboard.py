@@ -8,20 +8,45 @@ Usage:
     python scripts/generate_dashboard.py
     python scripts/generate_dashboard.py --output ./public
     python scripts/generate_dashboard.py --dry-run
+    python scripts/generate_dashboard.py --no-cache
+
+Scores are cached in a dashboard-only database next to the distill history
+database (kept out of ``distill history``), so re-runs only re-score content
+that changed. --dry-run doesn't use the cache. Install the ``http2`` extra to
+fetch over HTTP/2.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+import httpx
+
+try:
+    import h2  # noqa: F401  # type: ignore[import-not-found]
+
+    _HAS_HTTP2 = True
+except ImportError:
+    _HAS_HTTP2 = False
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Add src to path so we can import distill without installing
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+from distill.cache import _DEFAULT_DB_PATH, ScoreCache  # noqa: E402
 from distill.pipeline import Pipeline  # noqa: E402
 
 # Curated URLs with expected quality tiers.
@@ -55,6 +80,14 @@ CURATED_URLS = [
     ),
 ]
 
+# Upper bound on concurrent URL fetches — the work is I/O-bound, so one
+# slow host shouldn't stall the rest of the run.
+_MAX_FETCH_WORKERS = 16
+
+# Kept apart from the user's history.db so curated URLs don't show up in
+# `distill history`
+_CACHE_DB_PATH = Path(_DEFAULT_DB_PATH).with_name("dashboard.db")
+
 # Inline samples for --dry-run mode (no HTTP requests).
 DRY_RUN_SAMPLES = [
     {
@@ -123,26 +156,64 @@ DRY_RUN_SAMPLES = [
 ]
 
 
+def score_text(
+    pipeline: Pipeline,
+    text: str,
+    cache: ScoreCache | None = None,
+    source: str | None = None,
+    metadata: dict | None = None,
+    pending: list | None = None,
+) -> dict:
+    """Score text, reusing a cached report dict when the same content was seen before.
+
+    Fresh results are appended to *pending* as ScoreCache.put_many() entries so
+    the caller can store the whole run in one transaction.
+    """
+    if cache is not None:
+        cached = cache.get(text, scorer_names=scorer_names_for(pipeline))
+        if cached is not None:
+            return cached
+
+    report_dict = pipeline.score(text, metadata=metadata).to_dict()
+    if pending is not None:
+        pending.append((text, report_dict, source, metadata))
+    return report_dict
+
+
+def scorer_names_for(pipeline: Pipeline) -> list[str]:
+    """Scorer names used as part of the cache key."""
+    return [s.name for s in pipeline._scorers]
+
+
 def score_url_entry(
-    pipeline: Pipeline, url: str, description: str, expected_tier: str, timeout: float
+    pipeline: Pipeline,
+    url: str,
+    description: str,
+    expected_tier: str,
+    timeout: float,
+    cache: ScoreCache | None = None,
+    pending: list | None = None,
+    client: httpx.Client | None = None,
 ) -> dict:
     """Score a single URL and return a dashboard entry."""
     from distill.extractors import extract_from_url
 
     try:
-        extracted = extract_from_url(url, timeout=timeout)
+        extracted = extract_from_url(url, timeout=timeout, client=client)
         metadata = {"url": url, "title": extracted.get("title", "")}
-        report = pipeline.score(extracted["text"], metadata=metadata)
+        report = score_text(
+            pipeline, extracted["text"], cache, source=url, metadata=metadata, pending=pending
+        )
         return {
             "url": url,
             "description": description,
             "expected_tier": expected_tier,
             "title": extracted.get("title", ""),
-            "overall_score": round(report.overall_score, 3),
-            "grade": report.grade,
-            "label": report.label,
-            "word_count": report.word_count,
-            "dimensions": {r.name: round(r.score, 3) for r in report.scores},
+            "overall_score": report["overall_score"],
+            "grade": report["grade"],
+            "label": report["label"],
+            "word_count": report["word_count"],
+            "dimensions": {name: d["score"] for name, d in report["dimensions"].items()},
             "error": None,
         }
     except Exception as e:
@@ -160,19 +231,24 @@ def score_url_entry(
         }
 
 
-def score_inline_entry(pipeline: Pipeline, entry: dict) -> dict:
+def score_inline_entry(
+    pipeline: Pipeline,
+    entry: dict,
+    cache: ScoreCache | None = None,
+    pending: list | None = None,
+) -> dict:
     """Score an inline text sample for dry-run mode."""
-    report = pipeline.score(entry["text"])
+    report = score_text(pipeline, entry["text"], cache, source=entry["url"], pending=pending)
     return {
         "url": entry["url"],
         "description": entry["description"],
         "expected_tier": entry["expected_tier"],
         "title": entry["description"],
-        "overall_score": round(report.overall_score, 3),
-        "grade": report.grade,
-        "label": report.label,
-        "word_count": report.word_count,
-        "dimensions": {r.name: round(r.score, 3) for r in report.scores},
+        "overall_score": report["overall_score"],
+        "grade": report["grade"],
+        "label": report["label"],
+        "word_count": report["word_count"],
+        "dimensions": {name: d["score"] for name, d in report["dimensions"].items()},
         "error": None,
     }
 
@@ -188,6 +264,9 @@ def main():
     parser.add_argument(
         "--dry-run", action="store_true", help="Use inline samples instead of fetching URLs"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-score everything instead of using the cache"
+    )
     args = parser.parse_args()
 
     output_dir = Path(args.output)
@@ -195,16 +274,40 @@ def main():
 
     pipeline = Pipeline()
     results = []
+    # Freshly scored entries, written to the cache in one transaction at the end
+    pending: list = []
+    # Inline samples are cheap to score, so --dry-run (used by CI) skips the cache
+    cache = None if args.no_cache or args.dry_run else ScoreCache(_CACHE_DB_PATH)
 
     if args.dry_run:
         print("Dry run mode — using inline samples")
         for entry in DRY_RUN_SAMPLES:
             print(f"  Scoring: {entry['description']}...")
-            results.append(score_inline_entry(pipeline, entry))
+            results.append(score_inline_entry(pipeline, entry, cache, pending))
     else:
-        for url, description, tier in CURATED_URLS:
+
+        def _score_one(entry: tuple[str, str, str]) -> dict:
+            url, description, tier = entry
             print(f"  Scoring: {url}...")
-            results.append(score_url_entry(pipeline, url, description, tier, args.timeout))
+            return score_url_entry(
+                pipeline, url, description, tier, args.timeout, cache, pending, client
+            )
+
+        max_workers = min(_MAX_FETCH_WORKERS, len(CURATED_URLS)) or 1
+        # One pooled client shared by all workers: keep-alive connections and
+        # retries on transient connect failures. With h2 installed, requests to
+        # the same host multiplex over a single HTTP/2 connection.
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        transport = httpx.HTTPTransport(http2=_HAS_HTTP2, retries=2, limits=limits)
+        with (
+            httpx.Client(transport=transport) as client,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            results.extend(executor.map(_score_one, CURATED_URLS))
+
+    if cache is not None:
+        cache.put_many(pending, scorer_names=scorer_names_for(pipeline))
+        cache.close()
 
     # Sort by score descending, nulls last
     results.sort(
@@ -217,10 +320,17 @@ def main():
         "results": results,
     }
 
-    # Write data.json
+    # Write data.json atomically so a crash mid-write never leaves a truncated file
     data_path = output_dir / "data.json"
-    with open(data_path, "w") as f:
-        json.dump(dashboard_data, f, indent=2)
+    tmp_path = data_path.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        if _HAS_ORJSON:
+            f.write(orjson.dumps(dashboard_data))
+        else:
+            f.write(json.dumps(dashboard_data, separators=(",", ":")).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, data_path)
     print(f"Wrote {data_path}")
 
     # Copy index.html if it exists in the source dashboard/ directory
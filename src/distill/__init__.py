@@ -6,23 +6,86 @@ epistemic honesty, and structural quality.
 
 from __future__ import annotations
 
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-# Import scorers to trigger registration
-import distill.scorers  # noqa: F401
-from distill.cache import ScoreCache
-from distill.content_type import ContentType, detect_content_type
-from distill.extractors import extract_from_html, extract_from_url
-from distill.pipeline import (
-    ComparisonResult,
-    DimensionDelta,
-    ParagraphScore,
-    Pipeline,
-    QualityReport,
-)
+# Built-in scorers register themselves the first time the registry is queried
+# (see distill.scorer._load_builtin_scorers), so they are not imported here.
 from distill.profiles import ScorerProfile, get_profile, list_profiles, register_profile
 from distill.scorer import MatchHighlight, Scorer, ScoreResult, get_scorer, list_scorers, register
 
+if TYPE_CHECKING:
+    from distill.cache import ScoreCache
+    from distill.content_type import ContentType, detect_content_type
+    from distill.extractors import extract_from_html, extract_from_url
+    from distill.pipeline import (
+        ComparisonResult,
+        DimensionDelta,
+        ParagraphScore,
+        Pipeline,
+        QualityReport,
+    )
+
+# Names whose modules pull in heavy dependencies (sqlite3, httpx, readability) or
+# compile large regex tables (pipeline, content type detection), resolved on
+# first attribute access so `import distill` and `distill --help` stay cheap.
+_LAZY_ATTRS = {
+    "ComparisonResult": "distill.pipeline",
+    "ContentType": "distill.content_type",
+    "DimensionDelta": "distill.pipeline",
+    "ParagraphScore": "distill.pipeline",
+    "Pipeline": "distill.pipeline",
+    "QualityReport": "distill.pipeline",
+    "ScoreCache": "distill.cache",
+    "detect_content_type": "distill.content_type",
+    "extract_from_html": "distill.extractors",
+    "extract_from_url": "distill.extractors",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_pipeline(
+    scorers: tuple[str, ...],
+    weights: tuple[tuple[str, float], ...],
+    profile: str | None,
+) -> Pipeline:
+    from distill.pipeline import Pipeline
+
+    return Pipeline(scorers=list(scorers), weights=dict(weights), profile=profile)
+
+
+def _get_pipeline(
+    scorers: list[str] | None,
+    weights: dict[str, float] | None,
+    profile: str | None,
+    auto_profile: bool,
+) -> Pipeline:
+    """Return a Pipeline for these options, reusing one from earlier calls when possible.
+
+    Auto-profile pipelines carry per-text state (the detected content type), so
+    they are always built fresh.
+    """
+    if auto_profile:
+        from distill.pipeline import Pipeline
+
+        return Pipeline(scorers=scorers, weights=weights, profile=profile, auto_profile=True)
+    # Resolve the default scorer set so newly registered scorers get a new pipeline
+    scorer_key = tuple(scorers) if scorers is not None else tuple(list_scorers())
+    weight_key = tuple(sorted(weights.items())) if weights else ()
+    return _cached_pipeline(scorer_key, weight_key, profile)
+
 
 def score(
     text: str,
@@ -48,9 +111,7 @@ def score(
     Returns:
         QualityReport with overall score and per-dimension results.
     """
-    pipeline = Pipeline(
-        scorers=scorers, weights=weights, profile=profile, auto_profile=auto_profile
-    )
+    pipeline = _get_pipeline(scorers, weights, profile, auto_profile)
     return pipeline.score(text, metadata=metadata, include_paragraphs=include_paragraphs)
 
 
@@ -76,11 +137,11 @@ def score_url(
     Returns:
         QualityReport with overall score and per-dimension results.
     """
+    from distill.extractors import extract_from_url
+
     extracted = extract_from_url(url)
     metadata = {"url": extracted.get("url", url), "title": extracted.get("title", "")}
-    pipeline = Pipeline(
-        scorers=scorers, weights=weights, profile=profile, auto_profile=auto_profile
-    )
+    pipeline = _get_pipeline(scorers, weights, profile, auto_profile)
     return pipeline.score(
         extracted["text"], metadata=metadata, include_paragraphs=include_paragraphs
     )
@@ -110,11 +171,9 @@ def score_file(
     Returns:
         QualityReport with overall score and per-dimension results.
     """
-    with open(path) as f:
+    with open(path, encoding="utf-8", errors="replace") as f:
         text = f.read()
-    pipeline = Pipeline(
-        scorers=scorers, weights=weights, profile=profile, auto_profile=auto_profile
-    )
+    pipeline = _get_pipeline(scorers, weights, profile, auto_profile)
     return pipeline.score(text, metadata=metadata, include_paragraphs=include_paragraphs)
 
 
@@ -146,7 +205,7 @@ def compare(
     Returns:
         ComparisonResult with per-dimension deltas and overall winner.
     """
-    pipeline = Pipeline(scorers=scorers, weights=weights, profile=profile)
+    pipeline = _get_pipeline(scorers, weights, profile, auto_profile=False)
     return pipeline.compare(
         text_a,
         text_b,
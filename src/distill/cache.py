@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 _DEFAULT_DB_DIR = Path.home() / ".distill"
 _DEFAULT_DB_PATH = _DEFAULT_DB_DIR / "history.db"
 
@@ -27,12 +38,77 @@ CREATE TABLE IF NOT EXISTS score_history (
     scored_at TEXT NOT NULL,
     UNIQUE(text_hash, profile, scorer_set)
 );
+-- get() is served by the UNIQUE(text_hash, profile, scorer_set) autoindex.
+-- history() orders by scored_at and clear(before=...) filters on it.
+CREATE INDEX IF NOT EXISTS idx_score_history_scored_at ON score_history(scored_at);
 """
 
+# WAL makes synchronous=NORMAL safe (no corruption on crash, only the last
+# commits may roll back), which drops an fsync per commit.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+# Cache keys are the first 128 bits of the text's SHA-256, hex-encoded. Keys
+# written before schema version 1 were the full 64-char digest; truncating them
+# in place yields exactly the new key, so existing cache entries keep hitting.
+_KEY_HEX_CHARS = 32
+_SCHEMA_VERSION = 1
+_MIGRATE_KEYS_SQL = (
+    "UPDATE OR REPLACE score_history SET text_hash = substr(text_hash, 1, ?) "
+    "WHERE length(text_hash) > ?"
+)
+
+# Most recent report dicts kept in memory per ScoreCache, in front of SQLite.
+_HOT_CACHE_SIZE = 256
+
+_HISTORY_COLUMNS = "id, source, profile, overall_score, grade, word_count, scored_at"
+
+_INSERT_SQL = (
+    "INSERT OR REPLACE INTO score_history "
+    "(text_hash, source, profile, scorer_set, overall_score, grade, "
+    "word_count, scores_json, metadata_json, scored_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _dumps(obj: dict) -> str:
+    """Serialize *obj* to JSON, using orjson's native encoder when installed."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _loads(data: str) -> dict:
+    """Parse a JSON document written by _dumps()."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def hash_text(text: str) -> str:
+    """Return the content fingerprint used to key *text* in the cache.
+
+    This is a 128-bit truncated SHA-256 — the key only deduplicates content,
+    and hashlib's SHA-256 is hardware-accelerated on most CPUs. Callers that
+    both look up and store the same text can compute this once and pass it as
+    ``text_hash`` to ScoreCache.get(), put() and put_many().
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:_KEY_HEX_CHARS]
+
 
 class ScoreCache:
     """SQLite-backed score cache and history store.
 
+    Each thread gets its own SQLite connection, opened on first use, so one
+    instance can be shared by a thread pool; WAL mode lets those connections
+    read concurrently while one writes. Recently read reports are also kept in
+    a small in-memory LRU, so repeat lookups skip SQLite.
+
     Args:
         db_path: Path to the SQLite database file. Defaults to ~/.distill/history.db.
     """
@@ -42,25 +118,61 @@ class ScoreCache:
             db_path = _DEFAULT_DB_PATH
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(str(self._db_path))
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._hot: OrderedDict[tuple[str, str, str], dict] = OrderedDict()
+        self._hot_lock = threading.Lock()
         self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first access."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is used by one thread only; check_same_thread is
+            # disabled so close() can close them all from the owning thread.
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    def _migrate(self) -> None:
+        """Bring an older database up to _SCHEMA_VERSION."""
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version >= _SCHEMA_VERSION:
+            return
+        with self._conn:
+            self._conn.execute(_MIGRATE_KEYS_SQL, (_KEY_HEX_CHARS, _KEY_HEX_CHARS))
+            self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
 
     def close(self) -> None:
-        """Close the database connection."""
-        self._conn.close()
+        """Close the database connections opened by every thread."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
 
     @staticmethod
     def _cache_key(
-        text: str, profile: str | None, scorer_names: list[str] | None
+        text: str,
+        profile: str | None,
+        scorer_names: list[str] | None,
+        text_hash: str | None = None,
     ) -> tuple[str, str, str]:
-        """Compute cache key components.
+        """Compute cache key components, reusing *text_hash* when given.
 
         Returns:
             (text_hash, profile_str, scorer_set_str)
         """
-        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        if text_hash is None:
+            text_hash = hash_text(text)
         profile_str = profile or "default"
         scorer_set_str = ",".join(sorted(scorer_names)) if scorer_names else ""
         return text_hash, profile_str, scorer_set_str
@@ -70,21 +182,81 @@ class ScoreCache:
         text: str,
         profile: str | None = None,
         scorer_names: list[str] | None = None,
+        text_hash: str | None = None,
     ) -> dict | None:
         """Look up a cached score result.
 
+        Args:
+            text: The text content to look up.
+            profile: Profile name used for scoring.
+            scorer_names: List of scorer names used.
+            text_hash: Precomputed hash_text(text), to avoid hashing twice.
+
         Returns:
-            The stored report dict (from QualityReport.to_dict()), or None on cache miss.
+            The stored report dict (from QualityReport.to_dict()), or None on cache
+            miss. The dict may be shared with later lookups, so treat it as read-only.
         """
-        text_hash, profile_str, scorer_set_str = self._cache_key(text, profile, scorer_names)
+        key = self._cache_key(text, profile, scorer_names, text_hash)
+        with self._hot_lock:
+            report_dict = self._hot.get(key)
+            if report_dict is not None:
+                self._hot.move_to_end(key)
+                return report_dict
         row = self._conn.execute(
             "SELECT scores_json FROM score_history "
             "WHERE text_hash = ? AND profile = ? AND scorer_set = ?",
-            (text_hash, profile_str, scorer_set_str),
+            key,
         ).fetchone()
         if row is None:
             return None
-        return json.loads(row["scores_json"])
+        report_dict = _loads(row["scores_json"])
+        self._remember(key, report_dict)
+        return report_dict
+
+    def _remember(self, key: tuple[str, str, str], report_dict: dict) -> None:
+        """Add a report to the in-memory LRU, evicting the oldest entry when full."""
+        with self._hot_lock:
+            self._hot[key] = report_dict
+            self._hot.move_to_end(key)
+            if len(self._hot) > _HOT_CACHE_SIZE:
+                self._hot.popitem(last=False)
+
+    def _forget(self, key: tuple[str, str, str]) -> None:
+        """Drop a stale in-memory entry; the next get() re-reads the stored JSON.
+
+        Writes are not cached directly so that get() always returns what a JSON
+        round-trip produces (string keys, lists), never the caller's own dict.
+        """
+        with self._hot_lock:
+            self._hot.pop(key, None)
+
+    def _row(
+        self,
+        text: str,
+        report_dict: dict,
+        source: str | None,
+        profile: str | None,
+        scorer_names: list[str] | None,
+        metadata: dict | None,
+        scored_at: str,
+        text_hash: str | None = None,
+    ) -> tuple:
+        """Build the parameter tuple for one score_history row."""
+        text_hash, profile_str, scorer_set_str = self._cache_key(
+            text, profile, scorer_names, text_hash
+        )
+        return (
+            text_hash,
+            source,
+            profile_str,
+            scorer_set_str,
+            report_dict["overall_score"],
+            report_dict["grade"],
+            report_dict["word_count"],
+            _dumps(report_dict),
+            _dumps(metadata) if metadata else None,
+            scored_at,
+        )
 
     def put(
         self,
@@ -94,6 +266,7 @@ class ScoreCache:
         profile: str | None = None,
         scorer_names: list[str] | None = None,
         metadata: dict | None = None,
+        text_hash: str | None = None,
     ) -> None:
         """Save a score result to the cache and history.
 
@@ -104,34 +277,55 @@ class ScoreCache:
             profile: Profile name used for scoring.
             scorer_names: List of scorer names used.
             metadata: Optional source metadata.
+            text_hash: Precomputed hash_text(text), to avoid hashing twice.
         """
-        text_hash, profile_str, scorer_set_str = self._cache_key(text, profile, scorer_names)
         now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute(
-            "INSERT OR REPLACE INTO score_history "
-            "(text_hash, source, profile, scorer_set, overall_score, grade, "
-            "word_count, scores_json, metadata_json, scored_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                text_hash,
+        row = self._row(text, report_dict, source, profile, scorer_names, metadata, now, text_hash)
+        self._conn.execute(_INSERT_SQL, row)
+        self._forget((row[0], row[2], row[3]))
+        self._conn.commit()
+
+    def put_many(
+        self,
+        entries: Iterable[tuple],
+        profile: str | None = None,
+        scorer_names: list[str] | None = None,
+    ) -> None:
+        """Save several score results in a single transaction.
+
+        Args:
+            entries: (text, report_dict, source, metadata) tuples, optionally
+                followed by a precomputed hash_text(text) to avoid hashing twice.
+            profile: Profile name used for scoring all entries.
+            scorer_names: List of scorer names used for all entries.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [
+            self._row(
+                text,
+                report_dict,
                 source,
-                profile_str,
-                scorer_set_str,
-                report_dict["overall_score"],
-                report_dict["grade"],
-                report_dict["word_count"],
-                json.dumps(report_dict),
-                json.dumps(metadata) if metadata else None,
+                profile,
+                scorer_names,
+                metadata,
                 now,
-            ),
-        )
-        self._conn.commit()
+                text_hash[0] if text_hash else None,
+            )
+            for text, report_dict, source, metadata, *text_hash in entries
+        ]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.executemany(_INSERT_SQL, rows)
+        for row in rows:
+            self._forget((row[0], row[2], row[3]))
 
     def history(
         self,
         source: str | None = None,
         limit: int = 20,
         since: str | None = None,
+        include_scores: bool = True,
     ) -> list[dict]:
         """Query past scores.
 
@@ -139,11 +333,14 @@ class ScoreCache:
             source: Filter by source substring (case-insensitive).
             limit: Maximum number of entries to return.
             since: ISO 8601 date string; only return entries scored after this date.
+            include_scores: If False, skip loading and parsing the full stored
+                report; entries then have no "scores" key.
 
         Returns:
             List of history entry dicts, newest first.
         """
-        query = "SELECT * FROM score_history WHERE 1=1"
+        columns = _HISTORY_COLUMNS + (", scores_json" if include_scores else "")
+        query = f"SELECT {columns} FROM score_history WHERE 1=1"
         params: list = []
 
         if source:
@@ -158,8 +355,9 @@ class ScoreCache:
         params.append(limit)
 
         rows = self._conn.execute(query, params).fetchall()
-        return [
-            {
+        entries = []
+        for row in rows:
+            entry = {
                 "id": row["id"],
                 "source": row["source"],
                 "profile": row["profile"],
@@ -167,10 +365,11 @@ class ScoreCache:
                 "grade": row["grade"],
                 "word_count": row["word_count"],
                 "scored_at": row["scored_at"],
-                "scores": json.loads(row["scores_json"]),
             }
-            for row in rows
-        ]
+            if include_scores:
+                entry["scores"] = _loads(row["scores_json"])
+            entries.append(entry)
+        return entries
 
     def clear(
         self,
@@ -199,6 +398,8 @@ class ScoreCache:
 
         cursor = self._conn.execute(query, params)
         self._conn.commit()
+        with self._hot_lock:
+            self._hot.clear()
         return cursor.rowcount
 
     def stats(self) -> dict:
@@ -223,3 +424,18 @@ class ScoreCache:
             "oldest": row["oldest"],
             "newest": row["newest"],
         }
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_cache(db_path: Path) -> ScoreCache:
+    return ScoreCache(db_path)
+
+
+def get_cache() -> ScoreCache:
+    """Return the ScoreCache for the default database, shared within the process.
+
+    Opened on first use, so code that probes the cache repeatedly (e.g. per
+    source, or on every file change) doesn't reconnect and re-run the schema
+    setup each time.
+    """
+    return _shared_cache(Path(_DEFAULT_DB_PATH))
@@ -2,54 +2,147 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import heapq
+import io
 import sys
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
 
-# Import scorers to trigger registration
-import distill.scorers  # noqa: F401
-from distill.pipeline import Pipeline
+from distill import _get_pipeline
 
-# Force UTF-8 output on Windows to avoid cp1252 encoding errors
-if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+
+def _is_utf8(stream) -> bool:
+    """True if *stream* already encodes as UTF-8."""
+    return (getattr(stream, "encoding", None) or "").lower().replace("-", "") == "utf8"
+
+
+# Force UTF-8 output on Windows to avoid cp1252 encoding errors. Skipped when the
+# streams are already UTF-8 (UTF-8 mode, modern terminals).
+if sys.platform == "win32" and not (_is_utf8(sys.stdout) and _is_utf8(sys.stderr)):
     try:
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
         sys.stderr.reconfigure(encoding="utf-8", errors="replace")
     except Exception:
         pass  # Skip if running under test harness or other non-standard environment
 
-console = Console()
+
+class _LazyConsole:
+    """Stand-in for the shared rich Console that imports rich on first use.
+
+    Keeps `distill --help` and other commands that print nothing through rich
+    from paying rich's import cost. Built-in scorers likewise register on the
+    first registry lookup rather than at import time.
+    """
+
+    _console: Console | None = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+# Upper bound on concurrent URL fetches in `batch`, and on fetches to any one
+# host, so a batch of links to the same site doesn't hammer it
+_MAX_FETCH_WORKERS = 32
+_MAX_FETCHES_PER_HOST = 4
+
+# Ranked summaries longer than this are printed as an aligned plain-text table;
+# rich's per-cell rendering costs about a millisecond per row.
+_MAX_STYLED_ROWS = 200
+
+_JUSTIFY = {"left": str.ljust, "right": str.rjust, "center": str.center}
+
+# Flattens previews and snippets onto one line; a stray \r or \t would
+# otherwise break the row layout
+_ONE_LINE = str.maketrans("\n\r\t", "   ")
+
+
+# Bar color by tenth of the score: red below 0.5, yellow below 0.7, else green
+_BAR_COLORS = ("red",) * 5 + ("yellow",) * 2 + ("green",) * 4
+
+# Style of the grade letter in report panels
+_GRADE_STYLES = {
+    "A": "bold green",
+    "B": "bold cyan",
+    "C": "bold yellow",
+    "D": "bold red",
+    "F": "bold red",
+}
 
 
 def _score_bar(score: float, width: int = 20) -> Text:
-    """Render a visual score bar."""
-    filled = int(score * width)
-    empty = width - filled
-
-    if score >= 0.7:
-        color = "green"
-    elif score >= 0.5:
-        color = "yellow"
-    else:
-        color = "red"
+    """Render a visual score bar.
+
+    Returns a fresh copy each time, since callers append to the result.
+    """
+    color = _BAR_COLORS[min(10, max(0, int(score * 10)))]
+    return _build_score_bar(int(score * width), width, color, f" {score:.2f}").copy()
+
+
+@functools.lru_cache(maxsize=512)
+def _build_score_bar(filled: int, width: int, color: str, label: str) -> Text:
+    """Build a score bar; shared by every score with the same rendering."""
+    from rich.text import Text
 
     bar = Text()
     bar.append("#" * filled, style=color)
-    bar.append("." * empty, style="dim")
-    bar.append(f" {score:.2f}", style="bold")
+    bar.append("." * (width - filled), style="dim")
+    bar.append(label, style="bold")
     return bar
 
 
+def _plain_table(title: str, headers: list[str], rows: list[list[str]], justify: list[str]) -> str:
+    """Format *rows* as a plain-text table with aligned columns."""
+    widths = [max(map(len, column)) for column in zip(headers, *rows, strict=True)]
+    aligners = [_JUSTIFY[j] for j in justify]
+
+    def fmt(cells: list[str]) -> str:
+        return "  ".join(a(c, w) for a, c, w in zip(aligners, cells, widths, strict=True)).rstrip()
+
+    header = fmt(headers)
+    lines = [title.center(len(header)).rstrip(), header, "-" * len(header)]
+    lines.extend(fmt(row) for row in rows)
+    return "\n".join(lines)
+
+
 def _display_report(report, source: str = ""):
     """Rich display of a quality report."""
-    # Header
-    grade_colors = {"A": "green", "B": "cyan", "C": "yellow", "D": "red", "F": "red bold"}
-    grade_style = grade_colors.get(report.grade, "white")
+    rows = [(r.name, r.score, r.ci_lower, r.ci_upper, r.explanation) for r in report.scores]
+    _render_report(
+        report.grade, report.label, report.overall_score, report.word_count, rows, source
+    )
+
+
+def _render_report(
+    grade: str,
+    label: str,
+    overall_score: float,
+    word_count: int,
+    rows: list[tuple[str, float, float | None, float | None, str]],
+    source: str = "",
+) -> None:
+    """Print a report panel and its dimension table.
+
+    Args:
+        rows: (name, score, ci_lower, ci_upper, explanation) per dimension.
+    """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
 
     title = "Quality Report"
     if source:
@@ -58,13 +151,12 @@ def _display_report(report, source: str = ""):
     # Overall score panel
     overall = Text()
     overall.append("\n  Grade: ", style="bold")
-    overall.append(f"{report.grade}", style=f"bold {grade_style}")
-    overall.append(f"  ({report.label})\n", style="dim")
+    overall.append(f"{grade}", style=_GRADE_STYLES.get(grade, "bold white"))
+    overall.append(f"  ({label})\n", style="dim")
     overall.append("  Overall: ")
-    overall.append(_score_bar(report.overall_score))
-    overall.append(f"\n  Words: {report.word_count:,}\n")
-
-    console.print(Panel(overall, title=title, border_style="blue"))
+    overall.append(_score_bar(overall_score))
+    overall.append(f"\n  Words: {word_count:,}\n")
+    panel = Panel(overall, title=title, border_style="blue")
 
     # Dimension breakdown
     table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
@@ -72,20 +164,14 @@ def _display_report(report, source: str = ""):
     table.add_column("Score", min_width=25)
     table.add_column("Details", style="dim")
 
-    for result in report.scores:
-        ci_str = ""
-        if result.ci_lower is not None and result.ci_upper is not None:
-            ci_str = f" [{result.ci_lower:.2f}-{result.ci_upper:.2f}]"
-        score_text = _score_bar(result.score)
-        score_text.append(ci_str, style="dim")
-        table.add_row(
-            result.name,
-            score_text,
-            result.explanation[:80],
-        )
+    for name, score, ci_lower, ci_upper, explanation in rows:
+        score_text = _score_bar(score)
+        if ci_lower is not None and ci_upper is not None:
+            score_text.append(f" [{ci_lower:.2f}-{ci_upper:.2f}]", style="dim")
+        table.add_row(name, score_text, explanation[:80])
 
-    console.print(table)
-    console.print()
+    # Render the whole report in one print call rather than one per part
+    console.print(Group(panel, table, ""))
 
 
 @click.group()
@@ -99,9 +185,14 @@ def main():
     pass
 
 
-def _resolve_source(source: str, quiet: bool = False) -> tuple[str, str, dict | None]:
+def _resolve_source(source: str, quiet: bool = False, client=None) -> tuple[str, str, dict | None]:
     """Resolve a source (URL, file path, or '-' for stdin) to (label, text, metadata).
 
+    Args:
+        source: URL, file path, or '-' for stdin.
+        quiet: If True, don't print fetch progress.
+        client: Optional shared httpx.Client for URL sources.
+
     Returns:
         Tuple of (label, text content, metadata dict or None).
 
@@ -109,6 +200,11 @@ def _resolve_source(source: str, quiet: bool = False) -> tuple[str, str, dict |
         SystemExit: If the source cannot be resolved.
     """
     if source == "-":
+        # Decode like file sources: UTF-8 regardless of locale, bad bytes replaced.
+        # Not possible once stdin has been partly read; keep its decoding then.
+        if hasattr(sys.stdin, "reconfigure"):
+            with contextlib.suppress(ValueError, io.UnsupportedOperation):
+                sys.stdin.reconfigure(encoding="utf-8", errors="replace")
         return "stdin", sys.stdin.read(), None
     elif source.startswith(("http://", "https://")):
         from distill.extractors import extract_from_url
@@ -116,7 +212,7 @@ def _resolve_source(source: str, quiet: bool = False) -> tuple[str, str, dict |
         if not quiet:
             console.print(f"[dim]Fetching {source}...[/dim]")
         try:
-            extracted = extract_from_url(source)
+            extracted = extract_from_url(source, client=client)
             metadata = {"url": extracted.get("url", source), "title": extracted.get("title", "")}
             return extracted.get("title", source), extracted["text"], metadata
         except Exception as e:
@@ -124,13 +220,109 @@ def _resolve_source(source: str, quiet: bool = False) -> tuple[str, str, dict |
             raise SystemExit(1) from e
     else:
         try:
-            with open(source) as f:
+            with open(source, encoding="utf-8", errors="replace") as f:
                 return source, f.read(), None
         except FileNotFoundError as err:
             console.print(f"[red]File not found: {source}[/red]")
             raise SystemExit(1) from err
 
 
+def _resolve_sources(
+    sources: list[str],
+) -> tuple[list[tuple[str, str]], list[dict | None]]:
+    """Resolve several sources quietly, keeping their order.
+
+    Local files are read inline; URLs are fetched in parallel. Fetching is
+    I/O-bound, so the total time tracks the slowest URL rather than the sum.
+
+    Returns:
+        ((label, text) pairs, metadata dicts), both indexed like *sources*.
+
+    Raises:
+        SystemExit: If any source cannot be resolved.
+    """
+    texts: list[tuple[str, str]] = [None] * len(sources)  # type: ignore[list-item]
+    metadata_list: list[dict | None] = [None] * len(sources)
+    url_indices = []
+    for i, src in enumerate(sources):
+        if src.startswith(("http://", "https://")):
+            url_indices.append(i)
+        else:
+            label, text, meta = _resolve_source(src, quiet=True)
+            texts[i] = (label, text)
+            metadata_list[i] = meta
+
+    if url_indices:
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from importlib.util import find_spec
+        from urllib.parse import urlsplit
+
+        import httpx
+
+        max_workers = min(len(url_indices), _MAX_FETCH_WORKERS)
+        host_slots = {
+            urlsplit(sources[i]).netloc: threading.BoundedSemaphore(_MAX_FETCHES_PER_HOST)
+            for i in url_indices
+        }
+
+        def _fetch(i: int):
+            src = sources[i]
+            with host_slots[urlsplit(src).netloc]:
+                return _resolve_source(src, quiet=True, client=client)
+
+        # One pooled client so fetches to the same host reuse connections; with
+        # the http2 extra installed they multiplex over a single connection
+        limits = httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers)
+        http2 = find_spec("h2") is not None
+        with (
+            httpx.Client(limits=limits, http2=http2) as client,
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            fetched = executor.map(_fetch, url_indices)
+            for i, (label, text, meta) in zip(url_indices, fetched, strict=True):
+                texts[i] = (label, text)
+                metadata_list[i] = meta
+
+    return texts, metadata_list
+
+
+def _read_source_list(path: str) -> list[str]:
+    """Read a --from-file list: one source per line, blank lines skipped."""
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    return [s for s in map(str.strip, lines) if s]
+
+
+def _echo_json(data) -> None:
+    """Print *data* as indented JSON, using orjson's C encoder when installed."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        click.echo(json.dumps(data, indent=2))
+        return
+    _write_stdout_bytes(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) + b"\n"
+    )
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write already-encoded output straight to stdout's binary buffer.
+
+    Skips click.echo's per-call stream and color handling for large machine-
+    readable output; falls back to click.echo if stdout has no binary buffer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        click.echo(data, nl=False)
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
 def _report_to_dict(
     report,
     source: str | None = None,
@@ -147,59 +339,91 @@ def _report_to_dict(
     return data
 
 
+def _without_highlights(data: dict, source: str | None = None) -> dict:
+    """Copy a report dict built with highlights, dropping them from each dimension.
+
+    Matches ``report.to_dict(include_highlights=False)`` for reports serialized
+    without findings, so the dict already built for the cache can be reused.
+    """
+    dims = {
+        name: {k: v for k, v in dim.items() if k != "highlights"}
+        for name, dim in data["dimensions"].items()
+    }
+    if source is not None:
+        return {"source": source, **data, "dimensions": dims}
+    return {**data, "dimensions": dims}
+
+
 def _display_paragraphs(report) -> None:
     """Display strongest and weakest paragraph sections."""
     if not report.paragraph_scores:
         console.print("[dim]No paragraphs long enough to score individually.[/dim]\n")
         return
 
-    sorted_paras = sorted(report.paragraph_scores, key=lambda p: p.overall_score, reverse=True)
-    top = sorted_paras[:3]
-    bottom = sorted_paras[-3:] if len(sorted_paras) > 3 else []
+    paras = report.paragraph_scores
+    top = heapq.nlargest(3, paras, key=lambda p: p.overall_score)
+    # Weakest first; scanning in reverse keeps the same tie order as taking the
+    # tail of a descending sort and reversing it.
+    weakest = []
+    if len(paras) > 3:
+        weakest = heapq.nsmallest(3, reversed(paras), key=lambda p: p.overall_score)
     # Remove overlap if fewer than 6 paragraphs
-    bottom = [p for p in bottom if p not in top]
-
-    def _para_row(ps) -> str:
-        role_tag = f"[{ps.position_role}]"
-        dims = "  ".join(f"{r.name[:3]}={r.score:.2f}" for r in ps.scores)
-        preview = ps.text_preview.replace("\n", " ")
-        return (
-            f"  \u00b6{ps.index + 1:<3} {role_tag:<18}"
-            f' "{preview[:50]:<50}"  {ps.overall_score:.2f}  {dims}'
+    top_ids = {id(p) for p in top}
+    weakest = [p for p in weakest if id(p) not in top_ids]
+
+    from rich.text import Text
+
+    # Paragraphs are scored by the same scorers, in the same order, as the report
+    short_names = [r.name[:3] for r in report.scores]
+
+    # Rows are built as Text rather than markup strings: previews and the
+    # [role] tag are literal text and must not be parsed as rich markup.
+    def _para_row(ps) -> Text:
+        dims = "  ".join(
+            f"{short}={r.score:.2f}" for short, r in zip(short_names, ps.scores, strict=True)
         )
+        preview = ps.text_preview.translate(_ONE_LINE)
+        row = Text(f"  \u00b6{ps.index + 1:<3} ")
+        row.append(f"{f'[{ps.position_role}]':<18}", style="dim")
+        row.append(f' "{preview[:50]:<50}"  ')
+        row.append(f"{ps.overall_score:.2f}", style="bold")
+        row.append(f"  {dims}")
+        return row
 
-    console.print("[bold green]Strongest sections:[/bold green]")
-    for ps in top:
-        console.print(_para_row(ps))
+    lines: list[str | Text] = ["[bold green]Strongest sections:[/bold green]"]
+    lines.extend(_para_row(ps) for ps in top)
 
-    if bottom:
-        console.print("\n[bold red]Weakest sections:[/bold red]")
-        for ps in reversed(bottom):
-            console.print(_para_row(ps))
+    if weakest:
+        lines.append("\n[bold red]Weakest sections:[/bold red]")
+        lines.extend(_para_row(ps) for ps in weakest)
 
     # Show weighted paragraph score
     wps = report.weighted_paragraph_score
     if wps is not None:
-        console.print(f"\n  Weighted paragraph score: [bold]{wps:.3f}[/bold]")
+        lines.append(f"\n  Weighted paragraph score: [bold]{wps:.3f}[/bold]")
 
-    console.print()
+    lines.append("")
+    console.print(*lines, sep="\n")
 
 
 def _display_highlights(report) -> None:
     """Display matched highlights grouped by scorer."""
-    has_any = False
+    from rich.text import Text
+
+    lines: list[str | Text] = []
     for result in report.scores:
         if not result.highlights:
             continue
-        if not has_any:
-            console.print("[bold]Highlights:[/bold]")
-            has_any = True
-        console.print(f"  [cyan]{result.name}:[/cyan]")
+        if not lines:
+            lines.append("[bold]Highlights:[/bold]")
+        lines.append(Text(f"  {result.name}:", style="cyan"))
         for h in result.highlights[:10]:  # cap at 10 per scorer
-            display_text = h.text[:50]
-            console.print(f'    [{h.category:<15}] "{display_text}"  [dim](pos {h.position})[/dim]')
-    if has_any:
-        console.print()
+            row = Text(f'    [{h.category:<15}] "{h.text[:50]}"  ')
+            row.append(f"(pos {h.position})", style="dim")
+            lines.append(row)
+    if lines:
+        lines.append("")
+        console.print(*lines, sep="\n")
 
 
 _SEVERITY_STYLES = {
@@ -226,12 +450,14 @@ def _display_findings(report, text: str) -> None:
     Keeps the output terse and copy-paste friendly. Each finding gets one
     line: severity, scorer:category, line:col, quoted snippet, reason.
     """
+    from rich.text import Text
+
     findings = report.findings
     if not findings:
         console.print("[dim]No findings.[/dim]\n")
         return
 
-    console.print("[bold]Findings:[/bold]")
+    lines: list[str | Text] = ["[bold]Findings:[/bold]"]
     for f in findings:
         style = _SEVERITY_STYLES.get(f.severity, "white")
         if f.span is not None:
@@ -243,57 +469,29 @@ def _display_findings(report, text: str) -> None:
         tag.append(f"  {f.severity:<5}", style=style)
         tag.append(f"  {f.scorer}:{f.category:<16}", style="cyan")
         tag.append(f"  {loc:<8}", style="dim")
-        snippet = f.snippet[:60].replace("\n", " ")
+        snippet = f.snippet[:60].translate(_ONE_LINE)
         if snippet:
             tag.append(f' "{snippet}"  ')
         tag.append(f.reason, style="dim")
-        console.print(tag)
-    console.print()
+        lines.append(tag)
+    lines.append("")
+    console.print(*lines, sep="\n")
 
 
 def _display_report_from_dict(data: dict, source: str = "") -> None:
     """Rich display of a cached report dict (same layout as _display_report)."""
-    grade = data.get("grade", "?")
-    label = data.get("label", "")
-    overall_score = data.get("overall_score", 0.0)
-    word_count = data.get("word_count", 0)
-
-    grade_colors = {"A": "green", "B": "cyan", "C": "yellow", "D": "red", "F": "red bold"}
-    grade_style = grade_colors.get(grade, "white")
-
-    title = "Quality Report"
-    if source:
-        title += f" - {source[:60]}"
-
-    overall = Text()
-    overall.append("\n  Grade: ", style="bold")
-    overall.append(f"{grade}", style=f"bold {grade_style}")
-    overall.append(f"  ({label})\n", style="dim")
-    overall.append("  Overall: ")
-    overall.append(_score_bar(overall_score))
-    overall.append(f"\n  Words: {word_count:,}\n")
-
-    console.print(Panel(overall, title=title, border_style="blue"))
-
-    table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
-    table.add_column("Dimension", style="cyan")
-    table.add_column("Score", min_width=25)
-    table.add_column("Details", style="dim")
-
-    for name, dim in data.get("dimensions", {}).items():
-        ci_str = ""
-        if "ci_lower" in dim and "ci_upper" in dim:
-            ci_str = f" [{dim['ci_lower']:.2f}-{dim['ci_upper']:.2f}]"
-        score_text = _score_bar(dim["score"])
-        score_text.append(ci_str, style="dim")
-        table.add_row(
-            name,
-            score_text,
-            dim.get("explanation", "")[:80],
-        )
-
-    console.print(table)
-    console.print()
+    rows = [
+        (name, dim["score"], dim.get("ci_lower"), dim.get("ci_upper"), dim.get("explanation", ""))
+        for name, dim in data.get("dimensions", {}).items()
+    ]
+    _render_report(
+        data.get("grade", "?"),
+        data.get("label", ""),
+        data.get("overall_score", 0.0),
+        data.get("word_count", 0),
+        rows,
+        source,
+    )
 
 
 @main.command()
@@ -332,33 +530,32 @@ def score(
 
     scorer_names = scorers.split(",") if scorers else None
 
-    label, text, metadata = _resolve_source(source)
+    # Structured output goes to stdout, so fetch progress must not be mixed in
+    label, text, metadata = _resolve_source(source, quiet=as_json or as_csv)
 
     # Cache lookup — bypass when --explain is set since findings aren't cached.
-    from distill.cache import ScoreCache
+    from distill.cache import get_cache, hash_text
 
-    cache = ScoreCache()
+    cache = get_cache()
+    text_hash = hash_text(text)
     cached = None
     if not no_cache and not explain_mode:
-        cached = cache.get(text, profile=profile, scorer_names=scorer_names)
+        cached = cache.get(text, profile=profile, scorer_names=scorer_names, text_hash=text_hash)
 
     if cached is not None:
         if not as_json and not as_csv:
             console.print("[dim]Using cached result[/dim]")
         if as_json:
-            import json
-
-            click.echo(json.dumps(cached, indent=2))
+            _echo_json(cached)
         elif as_csv:
-            from distill.export import reports_to_csv
+            from distill.export import dict_to_csv_row, reports_to_csv
 
-            row = {"source": source, **cached}
-            click.echo(reports_to_csv([row]), nl=False)
+            click.echo(reports_to_csv([dict_to_csv_row(cached, source=source)]), nl=False)
         else:
             _display_report_from_dict(cached, source=label)
         return
 
-    pipeline = Pipeline(scorers=scorer_names, profile=profile, auto_profile=auto_profile)
+    pipeline = _get_pipeline(scorer_names, None, profile, auto_profile)
     report = pipeline.score(
         text,
         metadata=metadata,
@@ -376,6 +573,7 @@ def score(
         profile=profile,
         scorer_names=effective_scorer_names,
         metadata=metadata,
+        text_hash=text_hash,
     )
 
     if pipeline.detected_content_type and not as_json and not as_csv:
@@ -383,18 +581,17 @@ def score(
         console.print(f"[dim]Auto-detected: {ct.name} (confidence {ct.confidence:.2f})[/dim]")
 
     if as_json:
-        import json
-
-        data = _report_to_dict(
-            report,
-            include_highlights=highlights,
-            include_findings=explain_mode,
-        )
+        if explain_mode:
+            data = _report_to_dict(report, include_highlights=highlights, include_findings=True)
+        elif highlights:
+            data = report_dict
+        else:
+            data = _without_highlights(report_dict)
         if pipeline.detected_content_type:
             ct = pipeline.detected_content_type
             data["detected_type"] = ct.name
             data["detected_confidence"] = round(ct.confidence, 3)
-        click.echo(json.dumps(data, indent=2))
+        _echo_json(data)
     elif as_csv:
         from distill.export import report_to_csv_row, reports_to_csv
 
@@ -450,8 +647,7 @@ def batch(
 
     all_sources = list(sources)
     if from_file:
-        with open(from_file) as f:
-            all_sources.extend(line.strip() for line in f if line.strip())
+        all_sources.extend(_read_source_list(from_file))
 
     if not all_sources:
         console.print(
@@ -461,35 +657,23 @@ def batch(
 
     scorer_names = scorers.split(",") if scorers else None
 
-    # Resolve all sources in parallel
-    from concurrent.futures import ThreadPoolExecutor
-
-    def _resolve(src):
-        return (src, _resolve_source(src, quiet=True))
-
-    texts: list[tuple[str, str]] = []
-    metadata_list: list[dict | None] = []
-    source_keys: list[str] = []
-
-    max_workers = min(len(all_sources), 8)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        resolved = list(executor.map(_resolve, all_sources))
-
-    for src, (label, text, meta) in resolved:
-        texts.append((label, text))
-        metadata_list.append(meta)
-        source_keys.append(src)
+    texts, metadata_list = _resolve_sources(all_sources)
+    source_keys = all_sources
 
     # Cache: check for hits per item
-    from distill.cache import ScoreCache
+    from distill.cache import get_cache, hash_text
 
-    cache = ScoreCache()
+    cache = get_cache()
+    text_hashes = [hash_text(text) for _, text in texts]
 
     # Score (with per-item cache check)
-    pipeline = Pipeline(scorers=scorer_names, profile=profile, auto_profile=auto_profile)
+    pipeline = _get_pipeline(scorer_names, None, profile, auto_profile)
     effective_scorer_names = scorer_names or list(s.name for s in pipeline._scorers)
 
-    results: list[tuple[str, object]] = []
+    # Filled by original index, so no re-sort is needed afterwards
+    results: list[tuple[str, object, bool] | None] = [None] * len(texts)
+    # Summary dicts per index, reused by the ranked table
+    summary_dicts: list[dict | None] = [None] * len(texts)
     to_score_indices: list[int] = []
     to_score_texts: list[tuple[str, str]] = []
     to_score_metadata: list[dict | None] = []
@@ -497,78 +681,91 @@ def batch(
     for i, (label_text, meta) in enumerate(zip(texts, metadata_list, strict=True)):
         label, text = label_text
         if not no_cache:
-            cached = cache.get(text, profile=profile, scorer_names=effective_scorer_names)
+            cached = cache.get(
+                text,
+                profile=profile,
+                scorer_names=effective_scorer_names,
+                text_hash=text_hashes[i],
+            )
             if cached is not None:
-                results.append((i, label, cached, True))  # type: ignore[arg-type]
+                results[i] = (label, cached, True)
+                summary_dicts[i] = cached
                 continue
         to_score_indices.append(i)
         to_score_texts.append((label, text))
         to_score_metadata.append(meta)
 
-    if to_score_texts:
-        scored = pipeline.score_batch(to_score_texts, metadata=to_score_metadata)
-        for j, (label, report) in enumerate(scored):
-            idx = to_score_indices[j]
-            text = texts[idx][1]
-            report_dict = report.to_dict(include_highlights=True)
-            cache.put(
-                text,
-                report_dict,
-                source=source_keys[idx],
-                profile=profile,
-                scorer_names=effective_scorer_names,
-                metadata=metadata_list[idx],
-            )
-            results.append((idx, label, report, False))  # type: ignore[arg-type]
+    # Reports are yielded lazily in index order, so --jsonl and --csv can write
+    # each record as soon as it is scored instead of holding the whole batch
+    scored = pipeline.iter_score_batch(to_score_texts, metadata=to_score_metadata)
+
+    def _store(idx: int, report) -> dict:
+        report_dict = report.to_dict(include_highlights=True)
+        cache.put(
+            texts[idx][1],
+            report_dict,
+            source=source_keys[idx],
+            profile=profile,
+            scorer_names=effective_scorer_names,
+            metadata=metadata_list[idx],
+            text_hash=text_hashes[idx],
+        )
+        return report_dict
 
-    # Sort back to original order
-    results.sort(key=lambda x: x[0])  # type: ignore[index]
+    if as_jsonl or as_csv:
+        if as_jsonl:
+            from distill.export import dict_to_jsonl_bytes as from_dict
 
-    # Unpack — for cached items we have dicts, for scored items we have QualityReport
-    from distill.pipeline import QualityReport
+            def from_report(report, source: str) -> bytes:
+                return from_dict(report.to_dict(), source=source)
 
-    final_results: list[tuple[str, dict | QualityReport, bool]] = [
-        (label, data, is_cached)
-        for _, label, data, is_cached in results  # type: ignore[misc]
-    ]
+            emit = _write_stdout_bytes
 
-    if as_jsonl:
-        import json as json_mod
+        else:
+            import csv
 
-        for i, (_label, data, is_cached) in enumerate(final_results):
-            if is_cached:
-                assert isinstance(data, dict)
-                row_data = {"source": source_keys[i], **data}
-                click.echo(json_mod.dumps(row_data))
+            from distill.export import dict_to_csv_row as from_dict
+            from distill.export import report_to_csv_row as from_report
+
+            writer = None
+
+            def emit(row: dict) -> None:
+                nonlocal writer
+                if writer is None:
+                    # Every row comes from the same scorers, so the first row's
+                    # keys are the header
+                    writer = csv.DictWriter(sys.stdout, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+                sys.stdout.flush()
+
+        for i, cached in enumerate(summary_dicts):
+            if cached is not None:
+                emit(from_dict(cached, source=source_keys[i]))
             else:
-                from distill.export import report_to_jsonl_line
+                _label, report = next(scored)
+                _store(i, report)
+                emit(from_report(report, source=source_keys[i]))
+        return
 
-                assert isinstance(data, QualityReport)
-                click.echo(report_to_jsonl_line(data, source=source_keys[i]))
-    elif as_json:
-        import json
+    for idx, (label, report) in zip(to_score_indices, scored, strict=True):
+        results[idx] = (label, report, False)
+        summary_dicts[idx] = _store(idx, report)
+
+    # For cached items we have dicts, for scored items we have QualityReport
+    from distill.pipeline import QualityReport
 
+    final_results: list[tuple[str, dict | QualityReport, bool]] = results  # type: ignore[assignment]
+
+    if as_json:
         out = []
         for i, (_label, data, is_cached) in enumerate(final_results):
             if is_cached:
                 assert isinstance(data, dict)
                 out.append({"source": source_keys[i], **data})
             else:
-                assert isinstance(data, QualityReport)
-                out.append(_report_to_dict(data, source=source_keys[i]))
-        click.echo(json.dumps(out, indent=2))
-    elif as_csv:
-        from distill.export import report_to_csv_row, reports_to_csv
-
-        rows = []
-        for i, (_label, data, is_cached) in enumerate(final_results):
-            if is_cached:
-                assert isinstance(data, dict)
-                rows.append({"source": source_keys[i], **data})
-            else:
-                assert isinstance(data, QualityReport)
-                rows.append(report_to_csv_row(data, source=source_keys[i]))
-        click.echo(reports_to_csv(rows), nl=False)
+                out.append(_without_highlights(summary_dicts[i], source=source_keys[i]))
+        _echo_json(out)
     else:
         # Show individual reports
         for _i, (label, data, is_cached) in enumerate(final_results):
@@ -579,24 +776,17 @@ def batch(
                 assert isinstance(data, QualityReport)
                 _display_report(data, source=label)
 
-        # Ranked summary table — normalize to dicts for uniform access
-        ranked_data = []
-        for i, (label, data, _is_cached) in enumerate(final_results):
-            d = data if isinstance(data, dict) else data.to_dict()
-            ranked_data.append((source_keys[i], label, d))
-
-        ranked_data.sort(key=lambda x: x[2]["overall_score"], reverse=True)
-
-        table = Table(title="Ranked Summary", show_header=True, header_style="bold")
-        table.add_column("Rank", style="bold", justify="right", width=4)
-        table.add_column("Source", max_width=40)
-        table.add_column("Overall", justify="right")
-        table.add_column("Grade", justify="center")
-        first_dims = ranked_data[0][2].get("dimensions", {})
-        for _dim_name in first_dims:
-            table.add_column(_dim_name.title(), justify="right")
+        # Ranked summary table — dicts for uniform access (already built for the
+        # cache, so scored reports aren't converted a second time)
+        ranked_data = sorted(
+            zip(source_keys, summary_dicts, strict=True),
+            key=lambda x: x[1]["overall_score"],  # type: ignore[index]
+            reverse=True,
+        )
 
-        for rank, (src, _label, d) in enumerate(ranked_data, 1):
+        first_dims = ranked_data[0][1].get("dimensions", {})  # type: ignore[union-attr]
+        rows = []
+        for rank, (src, d) in enumerate(ranked_data, 1):
             row = [
                 str(rank),
                 src[:40],
@@ -605,14 +795,38 @@ def batch(
             ]
             for _dim_name, dim_data in d.get("dimensions", {}).items():
                 row.append(f"{dim_data['score']:.3f}")
-            table.add_row(*row)
+            rows.append(row)
 
-        console.print(table)
+        if len(rows) > _MAX_STYLED_ROWS:
+            headers = ["Rank", "Source", "Overall", "Grade", *(n.title() for n in first_dims)]
+            justify = ["right", "left", "right", "center", *(["right"] * len(first_dims))]
+            console.print(
+                _plain_table("Ranked Summary", headers, rows, justify),
+                markup=False,
+                highlight=False,
+                emoji=False,
+                soft_wrap=True,
+            )
+        else:
+            from rich.table import Table
+
+            table = Table(title="Ranked Summary", show_header=True, header_style="bold")
+            table.add_column("Rank", style="bold", justify="right", width=4)
+            table.add_column("Source", max_width=40)
+            table.add_column("Overall", justify="right")
+            table.add_column("Grade", justify="center")
+            for _dim_name in first_dims:
+                table.add_column(_dim_name.title(), justify="right")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
 
 
 @main.command(name="list")
 def list_scorers():
     """List available scorers."""
+    from rich.table import Table
+
     from distill.scorer import list_scorers as _list
 
     table = Table(show_header=True, header_style="bold")
@@ -628,6 +842,8 @@ def list_scorers():
 @main.command()
 def profiles():
     """List available scorer profiles."""
+    from rich.table import Table
+
     from distill.profiles import list_profiles as _list_profiles
 
     table = Table(show_header=True, header_style="bold")
@@ -664,10 +880,10 @@ def compare(
 
     scorer_names = scorers.split(",") if scorers else None
 
-    label_a, text_a, meta_a = _resolve_source(source_a)
-    label_b, text_b, meta_b = _resolve_source(source_b)
+    label_a, text_a, meta_a = _resolve_source(source_a, quiet=as_json)
+    label_b, text_b, meta_b = _resolve_source(source_b, quiet=as_json)
 
-    pipeline = Pipeline(scorers=scorer_names, profile=profile, auto_profile=auto_profile)
+    pipeline = _get_pipeline(scorer_names, None, profile, auto_profile)
     result = pipeline.compare(
         text_a,
         text_b,
@@ -678,15 +894,27 @@ def compare(
     )
 
     if as_json:
-        import json
-
-        click.echo(json.dumps(result.to_dict(), indent=2))
+        _echo_json(result.to_dict())
     else:
         _display_comparison(result, source_a, source_b)
 
 
+# Winner column cells in the comparison table; anything else is a tie
+_WINNER_CELLS = {"A": ("<-- A", "green"), "B": ("B -->", "green")}
+
+
+def _delta_style(delta: float) -> str:
+    """Color for a score delta: green if A leads, red if B leads."""
+    return "green" if delta > 0 else ("red" if delta < 0 else "dim")
+
+
 def _display_comparison(result, source_a: str, source_b: str) -> None:
     """Rich display of a comparison result."""
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(
         title="Comparison", show_header=True, header_style="bold", box=None, padding=(0, 2)
     )
@@ -697,64 +925,45 @@ def _display_comparison(result, source_a: str, source_b: str) -> None:
     table.add_column("Winner", justify="center")
 
     for d in result.dimension_deltas:
-        winner_str = ""
-        if d.winner == "A":
-            winner_str = "[green]<-- A[/green]"
-        elif d.winner == "B":
-            winner_str = "[green]B -->[/green]"
-        else:
-            winner_str = "[dim]tie[/dim]"
-
-        delta_color = "green" if d.delta > 0 else ("red" if d.delta < 0 else "dim")
-        delta_str = f"[{delta_color}]{d.delta:+.3f}[/{delta_color}]"
-
+        winner, winner_style = _WINNER_CELLS.get(d.winner, ("tie", "dim"))
         table.add_row(
             d.name,
             f"{d.score_a:.3f}",
             f"{d.score_b:.3f}",
-            delta_str,
-            winner_str,
+            Text.assemble((f"{d.delta:+.3f}", _delta_style(d.delta))),
+            Text.assemble((winner, winner_style)),
         )
 
     # Overall row
     table.add_row("", "", "", "", "")
     overall_delta = result.overall_delta
-    delta_color = "green" if overall_delta > 0 else ("red" if overall_delta < 0 else "dim")
     table.add_row(
-        "[bold]Overall[/bold]",
-        f"[bold]{result.report_a.overall_score:.3f}[/bold]",
-        f"[bold]{result.report_b.overall_score:.3f}[/bold]",
-        f"[bold {delta_color}]{overall_delta:+.3f}[/bold {delta_color}]",
+        Text.assemble(("Overall", "bold")),
+        Text.assemble((f"{result.report_a.overall_score:.3f}", "bold")),
+        Text.assemble((f"{result.report_b.overall_score:.3f}", "bold")),
+        Text.assemble((f"{overall_delta:+.3f}", f"bold {_delta_style(overall_delta)}")),
         "",
     )
 
-    console.print(table)
-
     # Winner banner
     if result.winner == "tie":
-        console.print(
-            Panel(
-                "[bold yellow]TIE[/bold yellow] — scores are within noise threshold",
-                border_style="yellow",
-            )
+        banner = Panel(
+            "[bold yellow]TIE[/bold yellow] — scores are within noise threshold",
+            border_style="yellow",
         )
     elif result.winner == "A":
-        console.print(
-            Panel(
-                f"[bold green]WINNER: A[/bold green] ({result.label_a}) "
-                f"by {abs(overall_delta):.3f}",
-                border_style="green",
-            )
+        banner = Panel(
+            f"[bold green]WINNER: A[/bold green] ({result.label_a}) by {abs(overall_delta):.3f}",
+            border_style="green",
         )
     else:
-        console.print(
-            Panel(
-                f"[bold green]WINNER: B[/bold green] ({result.label_b}) "
-                f"by {abs(overall_delta):.3f}",
-                border_style="green",
-            )
+        banner = Panel(
+            f"[bold green]WINNER: B[/bold green] ({result.label_b}) by {abs(overall_delta):.3f}",
+            border_style="green",
         )
 
+    console.print(Group(table, banner))
+
 
 @main.command()
 @click.option("--port", default=7331, help="Port to listen on (default: 7331)")
@@ -808,7 +1017,7 @@ def demo():
     the pain is concrete and measurable, not theoretical.
     """
 
-    pipeline = Pipeline()
+    pipeline = _get_pipeline(None, None, None, False)
 
     console.print("[bold red]Sample A: Generic AI-generated content[/bold red]")
     report_a = pipeline.score(ai_slop)
@@ -830,10 +1039,12 @@ def history():
 @click.option("--source", help="Filter by source substring")
 def history_show(limit: int, source: str | None):
     """Show recent scoring history."""
-    from distill.cache import ScoreCache
+    from rich.table import Table
+
+    from distill.cache import get_cache
 
-    cache = ScoreCache()
-    entries = cache.history(source=source, limit=limit)
+    cache = get_cache()
+    entries = cache.history(source=source, limit=limit, include_scores=False)
 
     if not entries:
         console.print("[dim]No history entries found.[/dim]")
@@ -868,9 +1079,9 @@ def history_show(limit: int, source: str | None):
 @click.confirmation_option(prompt="Are you sure you want to delete history entries?")
 def history_clear(before: str | None, source: str | None):
     """Clear scoring history."""
-    from distill.cache import ScoreCache
+    from distill.cache import get_cache
 
-    cache = ScoreCache()
+    cache = get_cache()
     deleted = cache.clear(before=before, source=source)
     console.print(f"Deleted {deleted} history entries.")
 
@@ -878,9 +1089,9 @@ def history_clear(before: str | None, source: str | None):
 @history.command(name="stats")
 def history_stats():
     """Show cache statistics."""
-    from distill.cache import ScoreCache
+    from distill.cache import get_cache
 
-    cache = ScoreCache()
+    cache = get_cache()
     stats = cache.stats()
 
     console.print("[bold]Cache Statistics[/bold]")
@@ -897,15 +1108,14 @@ def history_stats():
 @click.option("--source", help="Filter by source substring")
 def history_export(as_json: bool, as_csv: bool, limit: int, source: str | None):
     """Export scoring history."""
-    import json as json_mod
-
     if as_json and as_csv:
         raise click.UsageError("--json and --csv are mutually exclusive.")
 
-    from distill.cache import ScoreCache
+    from distill.cache import get_cache
 
-    cache = ScoreCache()
-    entries = cache.history(source=source, limit=limit)
+    cache = get_cache()
+    # CSV export only carries the summary columns
+    entries = cache.history(source=source, limit=limit, include_scores=not as_csv)
 
     if not entries:
         console.print("[dim]No history entries to export.[/dim]")
@@ -913,9 +1123,7 @@ def history_export(as_json: bool, as_csv: bool, limit: int, source: str | None):
 
     if as_csv:
         import csv
-        import io
 
-        buf = io.StringIO()
         fieldnames = [
             "id",
             "source",
@@ -925,14 +1133,12 @@ def history_export(as_json: bool, as_csv: bool, limit: int, source: str | None):
             "word_count",
             "scored_at",
         ]
-        writer = csv.DictWriter(buf, fieldnames=fieldnames)
+        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
-        for entry in entries:
-            writer.writerow({k: entry[k] for k in fieldnames})
-        click.echo(buf.getvalue(), nl=False)
+        writer.writerows(entries)
     else:
         # Default to JSON
-        click.echo(json_mod.dumps(entries, indent=2))
+        _echo_json(entries)
 
 
 _GRADE_ORDER = {"A": 4, "B": 3, "C": 2, "D": 1, "F": 0}
@@ -986,8 +1192,7 @@ def gate(
 
     all_sources = list(sources)
     if from_file:
-        with open(from_file) as f:
-            all_sources.extend(line.strip() for line in f if line.strip())
+        all_sources.extend(_read_source_list(from_file))
 
     if not all_sources:
         console.print(
@@ -998,71 +1203,72 @@ def gate(
     scorer_names = scorers.split(",") if scorers else None
     min_grade_upper = min_grade.upper()
 
-    pipeline = Pipeline(scorers=scorer_names, profile=profile, auto_profile=auto_profile)
+    pipeline = _get_pipeline(scorer_names, None, profile, auto_profile)
+
+    from distill.cache import get_cache, hash_text
+
+    cache = get_cache()
 
     # Score each source
     gate_results: list[dict] = []
     any_failed = False
 
-    for src in all_sources:
-        label, text, metadata = _resolve_source(src, quiet=True)
+    # URLs are fetched concurrently up front; scoring stays serial since it is
+    # CPU-bound
+    texts, metadata_list = _resolve_sources(all_sources)
 
-        # Cache check
-        report = None
-        if not no_cache:
-            from distill.cache import ScoreCache
-
-            cache = ScoreCache()
-            cached = cache.get(text, profile=profile, scorer_names=scorer_names)
-            if cached is not None:
-                score_val = cached["overall_score"]
-                grade_val = cached["grade"]
+    # Fresh scores are written in one short transaction once the loop ends (or
+    # exits early), so the database isn't write-locked while later sources score
+    pending: list[tuple] = []
+    try:
+        for src, (_label, text), metadata in zip(all_sources, texts, metadata_list, strict=True):
+            text_hash = hash_text(text)
+
+            # Cache check
+            report = None
+            if not no_cache:
+                cached = cache.get(
+                    text, profile=profile, scorer_names=scorer_names, text_hash=text_hash
+                )
+                if cached is not None:
+                    score_val = cached["overall_score"]
+                    grade_val = cached["grade"]
+                else:
+                    cached = None
+
+            if not no_cache and cached is not None:
+                pass  # score_val and grade_val already set
             else:
-                cached = None
+                report = pipeline.score(text, metadata=metadata)
+                score_val = report.overall_score
+                grade_val = report.grade
 
-        if not no_cache and cached is not None:
-            pass  # score_val and grade_val already set
-        else:
-            report = pipeline.score(text, metadata=metadata)
-            score_val = report.overall_score
-            grade_val = report.grade
-
-            # Save to cache
-            from distill.cache import ScoreCache
+                # Queue for the cache
+                report_dict = report.to_dict(include_highlights=False)
+                pending.append((text, report_dict, src, metadata, text_hash))
 
-            cache = ScoreCache()
-            effective = scorer_names or [s.name for s in pipeline._scorers]
-            report_dict = report.to_dict(include_highlights=False)
-            cache.put(
-                text,
-                report_dict,
-                source=src,
-                profile=profile,
-                scorer_names=effective,
-                metadata=metadata,
+            # Determine pass/fail
+            if min_score is not None:
+                passed = score_val >= min_score
+            else:
+                passed = _GRADE_ORDER.get(grade_val, 0) >= _GRADE_ORDER.get(min_grade_upper, 2)
+
+            if not passed:
+                any_failed = True
+
+            gate_results.append(
+                {
+                    "source": src,
+                    "score": round(score_val, 3),
+                    "grade": grade_val,
+                    "passed": passed,
+                }
             )
-
-        # Determine pass/fail
-        if min_score is not None:
-            passed = score_val >= min_score
-        else:
-            passed = _GRADE_ORDER.get(grade_val, 0) >= _GRADE_ORDER.get(min_grade_upper, 2)
-
-        if not passed:
-            any_failed = True
-
-        gate_results.append(
-            {
-                "source": src,
-                "score": round(score_val, 3),
-                "grade": grade_val,
-                "passed": passed,
-            }
-        )
+    finally:
+        effective = scorer_names or [s.name for s in pipeline._scorers]
+        cache.put_many(pending, profile=profile, scorer_names=effective)
 
     if as_json:
-        import json
-
         threshold = (
             {"min_score": min_score} if min_score is not None else {"min_grade": min_grade_upper}
         )
@@ -1071,9 +1277,11 @@ def gate(
             "all_passed": not any_failed,
             "results": gate_results,
         }
-        click.echo(json.dumps(output, indent=2))
+        _echo_json(output)
     else:
         # Compact table
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold", box=None, padding=(0, 2))
         table.add_column("Source", max_width=50)
         table.add_column("Score", justify="right")
@@ -1159,10 +1367,15 @@ def watch(
 
     import threading
 
+    # Hash of the text last written to the cache; saving an unchanged file
+    # re-displays the score without rewriting and committing the same row
+    last_stored_hash: str | None = None
+
     def _score_and_display():
         """Read the file, score it, and display the report."""
+        nonlocal last_stored_hash
         try:
-            with open(filepath) as f:
+            with open(filepath, encoding="utf-8", errors="replace") as f:
                 text = f.read()
         except Exception as e:
             console.print(f"[red]Error reading file: {e}[/red]")
@@ -1172,27 +1385,34 @@ def watch(
             console.print("[dim]File is empty, skipping.[/dim]")
             return
 
-        pipeline = Pipeline(scorers=scorer_names, profile=profile, auto_profile=auto_profile)
+        pipeline = _get_pipeline(scorer_names, None, profile, auto_profile)
         report = pipeline.score(text, include_paragraphs=paragraphs)
 
+        report_dict = report.to_dict(include_highlights=True)
+
         # Cache
         if not no_cache:
-            from distill.cache import ScoreCache
-
-            cache = ScoreCache()
-            effective = scorer_names or [s.name for s in pipeline._scorers]
-            report_dict = report.to_dict(include_highlights=True)
-            cache.put(text, report_dict, source=source, profile=profile, scorer_names=effective)
+            from distill.cache import get_cache, hash_text
+
+            text_hash = hash_text(text)
+            if text_hash != last_stored_hash:
+                effective = scorer_names or [s.name for s in pipeline._scorers]
+                get_cache().put(
+                    text,
+                    report_dict,
+                    source=source,
+                    profile=profile,
+                    scorer_names=effective,
+                    text_hash=text_hash,
+                )
+                last_stored_hash = text_hash
 
         if pipeline.detected_content_type and not as_json:
             ct = pipeline.detected_content_type
             console.print(f"[dim]Auto-detected: {ct.name} (confidence {ct.confidence:.2f})[/dim]")
 
         if as_json:
-            import json
-
-            data = _report_to_dict(report, include_highlights=highlights)
-            click.echo(json.dumps(data, indent=2))
+            _echo_json(report_dict if highlights else _without_highlights(report_dict))
         else:
             _display_report(report, source=source)
             if highlights:
@@ -1310,9 +1530,7 @@ def evaluate(
     )
 
     if as_json:
-        import json
-
-        click.echo(json.dumps(report.to_dict(), indent=2))
+        _echo_json(report.to_dict())
     else:
         _display_evaluation(report)
 
@@ -1322,61 +1540,64 @@ def evaluate(
 
 def _display_evaluation(report) -> None:
     """Rich display of evaluation results."""
-    console.print(f"\n[bold]Evaluation Results ({report.total_entries} entries)[/bold]")
-    console.print("=" * 50)
+    lines = [
+        f"\n[bold]Evaluation Results ({report.total_entries} entries)[/bold]",
+        "=" * 50,
+    ]
 
     # Tier separation
-    console.print("\n[bold]Tier Separation:[/bold]")
+    lines.append("\n[bold]Tier Separation:[/bold]")
     for ts in report.tier_stats:
-        console.print(
+        lines.append(
             f"  {ts.tier:<8} (n={ts.count:>2}):  "
             f"mean={ts.mean:.2f}  std={ts.std:.2f}  "
             f"range=[{ts.min_score:.2f}, {ts.max_score:.2f}]"
         )
 
     # Rank correlation
-    console.print("\n[bold]Rank Correlation:[/bold]")
+    lines.append("\n[bold]Rank Correlation:[/bold]")
     rho_color = "green" if report.spearman_rho >= 0.70 else "red"
-    console.print(
+    lines.append(
         f"  Spearman rho = [{rho_color}]{report.spearman_rho:.4f}[/{rho_color}]"
         f"  (p = {report.spearman_p_value:.6f})"
     )
 
     # Classification
-    console.print("\n[bold]Tier Classification:[/bold]")
+    lines.append("\n[bold]Tier Classification:[/bold]")
     acc_color = "green" if report.classification_accuracy >= 0.70 else "yellow"
-    console.print(
+    lines.append(
         f"  Accuracy: [{acc_color}]{report.classification_accuracy:.0%}[/{acc_color}]"
         f" ({report.correct_count}/{report.total_entries})"
     )
     if report.misclassifications:
-        console.print("  Misclassified:")
+        lines.append("  Misclassified:")
         for m in report.misclassifications[:10]:
-            console.print(
+            lines.append(
                 f"    - {m.entry_id}: scored {m.score:.2f} "
                 f"(expected {m.expected_tier}, got {m.predicted_tier})"
             )
         if len(report.misclassifications) > 10:
-            console.print(f"    ... and {len(report.misclassifications) - 10} more")
+            lines.append(f"    ... and {len(report.misclassifications) - 10} more")
 
     # Per content type
     if report.content_type_stats:
-        console.print("\n[bold]Per Content Type:[/bold]")
+        lines.append("\n[bold]Per Content Type:[/bold]")
         for ct in report.content_type_stats:
             ct_color = "green" if ct.spearman_rho >= 0.70 else "yellow"
-            console.print(
+            lines.append(
                 f"  {ct.content_type:<12}  "
                 f"rho=[{ct_color}]{ct.spearman_rho:.2f}[/{ct_color}]  "
                 f"(n={ct.count})"
             )
 
     # Pass/fail
-    console.print()
+    lines.append("")
     if report.passed:
-        console.print(f"[green bold]PASS[/green bold] (rho >= {0.70:.2f})")
+        lines.append(f"[green bold]PASS[/green bold] (rho >= {0.70:.2f})")
     else:
-        console.print(f"[red bold]FAIL[/red bold] (rho < {0.70:.2f})")
-    console.print()
+        lines.append(f"[red bold]FAIL[/red bold] (rho < {0.70:.2f})")
+    lines.append("")
+    console.print(*lines, sep="\n")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ from __future__ import annotations
 
 import math
 
+# Log-interpolation endpoints for the length-based half-width (see below)
+_LOG_MIN_WORDS = math.log(50)
+_LOG_WORDS_SPAN = math.log(2000) - _LOG_MIN_WORDS
+
 
 def compute_confidence_interval(
     score: float,
@@ -35,7 +39,7 @@ def compute_confidence_interval(
         base_hw = 0.03
     else:
         # Log interpolation: log(50)→0.15, log(2000)→0.03
-        t = (math.log(word_count) - math.log(50)) / (math.log(2000) - math.log(50))
+        t = (math.log(word_count) - _LOG_MIN_WORDS) / _LOG_WORDS_SPAN
         base_hw = 0.15 - t * (0.15 - 0.03)
 
     # Signal density adjustment: fewer signals → wider interval
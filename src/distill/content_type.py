@@ -11,6 +11,8 @@ import re
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
+from distill.features import text_features
+
 
 @dataclass
 class ContentType:
@@ -23,9 +25,21 @@ class ContentType:
 
 # --- Signal patterns ---
 
-_TECHNICAL_PATTERNS = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
+
+def _compile_lowered(patterns: list[str]) -> list[tuple[str, re.Pattern[str]]]:
+    """Compile case-insensitive *patterns* for matching against lowercased text.
+
+    re can't use its literal fast search under IGNORECASE, so lowercasing the
+    text once and matching lowercase patterns finds the same matches faster.
+    None of the patterns use uppercase escapes (\\B, \\D, \\S, \\W), so lowercasing
+    their source is safe. Each pattern is paired with its original source
+    prefix, the key reported in ContentType.signals.
+    """
+    return [(p[:40], re.compile(p.lower())) for p in patterns]
+
+
+_TECHNICAL_PATTERNS = _compile_lowered(
+    [
         r"```",  # code fences
         r"`[a-zA-Z_]\w*(?:\(\))?`",  # inline code
         r"\bv\d+\.\d+",  # version numbers (v2.3, v1.0.1)
@@ -38,11 +52,10 @@ _TECHNICAL_PATTERNS = [
         r"\b(?:docker|kubernetes|k8s|nginx|postgres|redis|kafka)\b",
         r"\b(?:monolith|microservice|pipeline|deploy|CI/CD)\b",
     ]
-]
+)
 
-_NEWS_PATTERNS = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
+_NEWS_PATTERNS = _compile_lowered(
+    [
         r"\baccording to\b",
         r"\bsources? (?:say|said|told|confirmed|reported|familiar)\b",
         r'\b(?:said|told|stated|announced|confirmed) (?:in |that |")',
@@ -54,11 +67,10 @@ _NEWS_PATTERNS = [
         r"\breported (?:by|that|on)\b",
         r"\b(?:Reuters|AP|AFP|Bloomberg|CNN|BBC|NYT)\b",
     ]
-]
+)
 
-_OPINION_PATTERNS = [
-    re.compile(p, re.IGNORECASE)
-    for p in [
+_OPINION_PATTERNS = _compile_lowered(
+    [
         r"\bI (?:think|believe|feel|argue|contend|suspect|would)\b",
         r"\bin my (?:experience|view|opinion|estimation)\b",
         r"\bpersonally,?\b",
@@ -73,7 +85,7 @@ _OPINION_PATTERNS = [
         r"\bunpopular opinion\b",
         r"\bhere'?s (?:the thing|why|what)\b",
     ]
-]
+)
 
 _CONFIDENCE_THRESHOLD = 0.15
 
@@ -195,8 +207,9 @@ def detect_content_type(text: str, metadata: dict | None = None) -> ContentType:
     if not text or not text.strip():
         return ContentType(name="default", confidence=0.0)
 
-    words = text.split()
-    word_count = len(words)
+    # Shared with the scorers, so the pipeline splits and lowercases the text once
+    features = text_features(text)
+    word_count = features.word_count
     if word_count == 0:
         return ContentType(name="default", confidence=0.0)
 
@@ -214,11 +227,11 @@ def detect_content_type(text: str, metadata: dict | None = None) -> ContentType:
     ]:
         total_hits = 0
         signal_counts: dict[str, int] = {}
-        for pattern in patterns:
-            matches = pattern.findall(text)
+        for key, pattern in patterns:
+            matches = pattern.findall(features.lower)
             if matches:
                 total_hits += len(matches)
-                signal_counts[pattern.pattern[:40]] = len(matches)
+                signal_counts[key] = len(matches)
 
         # Normalize: hits per 100 words, capped at 1.0
         density = min(total_hits / (word_count / 100), 1.0) if word_count > 0 else 0.0
@@ -226,6 +239,10 @@ def detect_content_type(text: str, metadata: dict | None = None) -> ContentType:
         if density > 0 and url_boosts.get(label, 0.0) > 0:
             density = min(density + url_boosts[label], 1.0)
         scores[label] = (density, signal_counts)
+        if density >= 1.0:
+            # Densities are capped at 1.0 and ties go to the earlier category,
+            # so the remaining categories can't win; skip scanning for them
+            break
 
     # Pick winner
     best_label = max(scores, key=lambda k: scores[k][0])
@@ -150,7 +150,7 @@ class EvaluationReport:
 def load_corpus(path: Path | str | None = None) -> list[CorpusEntry]:
     """Load evaluation corpus from YAML file."""
     corpus_path = Path(path) if path else DEFAULT_CORPUS_PATH
-    with open(corpus_path) as f:
+    with open(corpus_path, encoding="utf-8") as f:
         data = yaml.safe_load(f)
 
     entries = []
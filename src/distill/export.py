@@ -9,6 +9,13 @@ from typing import IO
 
 from distill.pipeline import QualityReport
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 
 def report_to_csv_row(report: QualityReport, source: str | None = None) -> dict:
     """Flatten a QualityReport into a single CSV-friendly dict.
@@ -33,6 +40,29 @@ def report_to_csv_row(report: QualityReport, source: str | None = None) -> dict:
     return row
 
 
+def dict_to_csv_row(data: dict, source: str | None = None) -> dict:
+    """Flatten a report dict (e.g. from the score cache) like report_to_csv_row().
+
+    Args:
+        data: Report dict as produced by QualityReport.to_dict().
+        source: Optional source label (URL, filename, etc.).
+
+    Returns:
+        Dict with the same keys and values report_to_csv_row() gives for the report.
+    """
+    row: dict = {}
+    if source is not None:
+        row["source"] = source
+    row["overall_score"] = data["overall_score"]
+    row["grade"] = data["grade"]
+    row["label"] = data["label"]
+    row["word_count"] = data["word_count"]
+    dimensions = data.get("dimensions", {})
+    for name in sorted(dimensions):
+        row[f"{name}_score"] = dimensions[name]["score"]
+    return row
+
+
 def reports_to_csv(
     rows: list[dict],
     output: IO[str] | None = None,
@@ -79,7 +109,36 @@ def report_to_jsonl_line(
     Returns:
         A single-line JSON string (no trailing newline).
     """
-    data = report.to_dict(include_highlights=include_highlights)
+    return dict_to_jsonl_line(report.to_dict(include_highlights=include_highlights), source)
+
+
+def dict_to_jsonl_line(data: dict, source: str | None = None) -> str:
+    """Serialize a report dict (e.g. from the score cache) as one JSONL line.
+
+    Uses orjson when installed; otherwise the stdlib encoder in compact form.
+
+    Args:
+        data: Report dict as produced by QualityReport.to_dict().
+        source: Optional source label, placed first in the line.
+
+    Returns:
+        A single-line JSON string (no trailing newline).
+    """
     if source is not None:
         data = {"source": source, **data}
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(data, separators=(",", ":"))
+
+
+def dict_to_jsonl_bytes(data: dict, source: str | None = None) -> bytes:
+    """Like dict_to_jsonl_line(), but UTF-8 encoded with the trailing newline.
+
+    With orjson the newline is appended by the encoder itself, so a line can
+    go straight to a binary stream without a str round trip.
+    """
+    if source is not None:
+        data = {"source": source, **data}
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
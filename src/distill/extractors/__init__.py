@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import re
+import time
+
 import httpx
 from readability import Document
 
+# Longest Retry-After (seconds) on a 429 that extract_from_url waits out and
+# retries once; longer waits surface as the usual HTTP error.
+_MAX_RETRY_AFTER = 10.0
+
 
-def extract_from_url(url: str, timeout: float = 15.0) -> dict:
+def extract_from_url(url: str, timeout: float = 15.0, client: httpx.Client | None = None) -> dict:
     """Fetch a URL and extract readable content.
 
+    Args:
+        url: URL to fetch.
+        timeout: Request timeout in seconds.
+        client: Optional shared httpx.Client, so repeated fetches reuse pooled
+            keep-alive connections instead of opening a new one per call.
+
     Returns:
         dict with keys: title, text, url, word_count
     """
@@ -18,12 +31,27 @@ def extract_from_url(url: str, timeout: float = 15.0) -> dict:
         ),
     }
 
-    response = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
+    get = client.get if client is not None else httpx.get
+    response = get(url, headers=headers, timeout=timeout, follow_redirects=True)
+    if response.status_code == 429:
+        delay = _retry_after_seconds(response)
+        if delay is not None:
+            time.sleep(delay)
+            response = get(url, headers=headers, timeout=timeout, follow_redirects=True)
     response.raise_for_status()
 
     return extract_from_html(response.text, url=url)
 
 
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Delay requested by a Retry-After header, if it is short enough to honour."""
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None  # missing, or the HTTP-date form
+    return delay if 0 <= delay <= _MAX_RETRY_AFTER else None
+
+
 def extract_from_html(html: str, url: str = "") -> dict:
     """Extract readable text from HTML using readability."""
     doc = Document(html)
@@ -41,19 +69,24 @@ def extract_from_html(html: str, url: str = "") -> dict:
     }
 
 
+_BLOCK_TAG_RE = re.compile(r"<(?:p|br|div|h[1-6]|li|tr)[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r" +")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
 def _strip_html(html: str) -> str:
     """Simple HTML tag stripping. Preserves paragraph structure."""
-    import re
-
     # Replace block elements with newlines
-    text = re.sub(r"<(?:p|br|div|h[1-6]|li|tr)[^>]*>", "\n", html, flags=re.IGNORECASE)
+    text = _BLOCK_TAG_RE.sub("\n", html)
     # Remove all remaining tags
-    text = re.sub(r"<[^>]+>", " ", text)
-    # Decode common entities
-    text = text.replace("&amp;", "&").replace("&lt;", "<").replace("&gt;", ">")
-    text = text.replace("&quot;", '"').replace("&#39;", "'").replace("&nbsp;", " ")
+    text = _TAG_RE.sub(" ", text)
+    # Decode common entities; &amp; goes last so escaped text like "&amp;lt;"
+    # comes out as "&lt;" rather than being decoded twice
+    text = text.replace("&lt;", "<").replace("&gt;", ">").replace("&quot;", '"')
+    text = text.replace("&#39;", "'").replace("&nbsp;", " ").replace("&amp;", "&")
     # Clean up whitespace
-    text = re.sub(r" +", " ", text)
-    text = re.sub(r"\n\s*\n", "\n\n", text)
+    text = _SPACES_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     return text.strip()
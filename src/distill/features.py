@@ -0,0 +1,76 @@
+"""Text features shared across scorers.
+
+Several scorers need the same basic tokenizations of a text (whitespace words,
+rough sentences, lowercased form). Pipeline.score() builds one TextFeatures per
+call and shares it through shared_features(), so N scorers over the same content
+split it once instead of N times. Nothing is kept once the call returns.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cached_property
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+@dataclass(frozen=True)
+class TextFeatures:
+    """Lazily computed tokenizations of a single text.
+
+    Each property is computed on first access and cached on the instance.
+    Sequences are tuples so scorers sharing an instance cannot mutate them.
+    """
+
+    text: str
+
+    @cached_property
+    def words(self) -> tuple[str, ...]:
+        """Whitespace-separated tokens, as ``text.split()``."""
+        return tuple(self.text.split())
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace-separated tokens."""
+        return len(self.words)
+
+    @cached_property
+    def sentences(self) -> tuple[str, ...]:
+        """Raw sentence split on terminal punctuation (pieces are not stripped)."""
+        return tuple(_SENTENCE_SPLIT_RE.split(self.text))
+
+    @cached_property
+    def lower(self) -> str:
+        """The text lowercased."""
+        return self.text.lower()
+
+
+_active: ContextVar[TextFeatures | None] = ContextVar("distill_text_features", default=None)
+
+
+@contextmanager
+def shared_features(text: str) -> Iterator[TextFeatures]:
+    """Share one TextFeatures for *text* with every text_features() call in the block."""
+    features = TextFeatures(text)
+    token = _active.set(features)
+    try:
+        yield features
+    finally:
+        _active.reset(token)
+
+
+def text_features(text: str) -> TextFeatures:
+    """Return the TextFeatures for *text*.
+
+    Inside shared_features() for the same text this is the shared instance, so
+    features computed by one scorer are reused by the next. Otherwise (e.g. a
+    scorer called directly) a fresh instance is built.
+    """
+    active = _active.get()
+    if active is not None and active.text == text:
+        return active
+    return TextFeatures(text)
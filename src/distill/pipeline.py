@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Literal
 
+from distill.features import shared_features
 from distill.scorer import Finding, Scorer, ScoreResult, get_scorer, list_scorers
 
 _PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
 _MIN_PARAGRAPH_WORDS = 30
+# Below this many texts, starting worker processes costs more than it saves
+_MIN_PROCESS_BATCH = 4
 
 
 def _compute_position_weights(count: int) -> list[tuple[float, str]]:
@@ -134,6 +138,9 @@ class QualityReport:
             "word_count": self.word_count,
             "dimensions": {},
         }
+        # (finding, serialized finding) pairs, so the top-level list reuses the
+        # per-dimension dicts instead of serializing every finding twice
+        finding_dicts: list[tuple[Finding, dict]] = []
         for r in self.scores:
             dim: dict = {
                 "score": round(r.score, 3),
@@ -147,10 +154,14 @@ class QualityReport:
             if include_highlights and r.highlights:
                 dim["highlights"] = [h.to_dict() for h in r.highlights]
             if include_findings and r.findings:
-                dim["findings"] = [f.to_dict() for f in r.findings]
+                pairs = [(f, f.to_dict()) for f in r.findings]
+                dim["findings"] = [d for _, d in pairs]
+                finding_dicts.extend(pairs)
             data["dimensions"][r.name] = dim
         if include_findings:
-            data["findings"] = [f.to_dict() for f in self.findings]
+            # Same document order as the findings property
+            finding_dicts.sort(key=lambda pair: pair[0].span[0] if pair[0].span is not None else -1)
+            data["findings"] = [d for _, d in finding_dicts]
         if self.paragraph_scores:
             data["paragraphs"] = [ps.to_dict() for ps in self.paragraph_scores]
             wps = self.weighted_paragraph_score
@@ -241,6 +252,9 @@ class Pipeline:
         if weights:
             profile_weights.update(weights)
 
+        # Configured weights, kept separately so auto-profile detection starts
+        # from them for every text instead of from the previous text's profile.
+        self._base_weight_overrides = profile_weights
         self._weight_overrides = profile_weights
 
     @property
@@ -257,8 +271,21 @@ class Pipeline:
         self._detected_content_type = ct
         if ct.name != "default":
             profile_weights = dict(get_profile(ct.name).weights)
-            profile_weights.update(self._weight_overrides)
+            profile_weights.update(self._base_weight_overrides)
             self._weight_overrides = profile_weights
+        else:
+            self._weight_overrides = self._base_weight_overrides
+
+    def _scorer_weights(self) -> list[float]:
+        """Effective weight of each configured scorer, aligned with self._scorers."""
+        return [self._weight_overrides.get(s.name, s.weight) for s in self._scorers]
+
+    @staticmethod
+    def _weighted_mean(results: list[ScoreResult], weights: list[float], total: float) -> float:
+        """Weighted average of scorer results; 0.0 when all weights are zero."""
+        if total <= 0:
+            return 0.0
+        return sum(r.score * w for r, w in zip(results, weights, strict=True)) / total
 
     def score(
         self,
@@ -279,60 +306,59 @@ class Pipeline:
         if not text or not text.strip():
             return QualityReport(overall_score=0.0, text_length=0, word_count=0)
 
-        if self._auto_profile:
-            self._apply_auto_profile(text, metadata)
-
-        results: list[ScoreResult] = []
-        total_weight = 0.0
-        weighted_sum = 0.0
+        # Content-type detection and every scorer share one set of tokenizations
+        with shared_features(text) as features:
+            if self._auto_profile:
+                self._apply_auto_profile(text, metadata)
 
-        for scorer in self._scorers:
-            result = scorer.score(text, metadata)
-            if explain:
-                result.findings = scorer.explain(text, result, metadata)
-            results.append(result)
+            # Resolve weights once per call; paragraphs reuse the same vector.
+            weights = self._scorer_weights()
+            total_weight = sum(weights)
 
-            weight = self._weight_overrides.get(scorer.name, scorer.weight)
-            weighted_sum += result.score * weight
-            total_weight += weight
+            results: list[ScoreResult] = []
+            for scorer in self._scorers:
+                result = scorer.score(text, metadata)
+                if explain:
+                    result.findings = scorer.explain(text, result, metadata)
+                results.append(result)
+            word_count = features.word_count
 
-        overall = weighted_sum / total_weight if total_weight > 0 else 0.0
+        overall = self._weighted_mean(results, weights, total_weight)
 
         paragraph_scores: list[ParagraphScore] = []
         if include_paragraphs:
-            paragraph_scores = self._score_paragraphs(text, metadata)
+            paragraph_scores = self._score_paragraphs(text, metadata, weights)
 
         return QualityReport(
             overall_score=overall,
             scores=results,
             text_length=len(text),
-            word_count=len(text.split()),
+            word_count=word_count,
             paragraph_scores=paragraph_scores,
         )
 
-    def _score_paragraphs(self, text: str, metadata: dict | None = None) -> list[ParagraphScore]:
+    def _score_paragraphs(
+        self,
+        text: str,
+        metadata: dict | None = None,
+        weights: list[float] | None = None,
+    ) -> list[ParagraphScore]:
         """Score individual paragraphs within the text."""
+        if weights is None:
+            weights = self._scorer_weights()
+        total_weight = sum(weights)
         paragraphs = _PARAGRAPH_SPLIT.split(text.strip())
         scored: list[ParagraphScore] = []
 
         for idx, para in enumerate(paragraphs):
             para = para.strip()
-            words = para.split()
-            if len(words) < _MIN_PARAGRAPH_WORDS:
-                continue
-
-            para_results: list[ScoreResult] = []
-            total_weight = 0.0
-            weighted_sum = 0.0
-
-            for scorer in self._scorers:
-                result = scorer.score(para, metadata)
-                para_results.append(result)
-                weight = self._weight_overrides.get(scorer.name, scorer.weight)
-                weighted_sum += result.score * weight
-                total_weight += weight
+            with shared_features(para) as features:
+                word_count = features.word_count
+                if word_count < _MIN_PARAGRAPH_WORDS:
+                    continue
 
-            para_overall = weighted_sum / total_weight if total_weight > 0 else 0.0
+                para_results = [scorer.score(para, metadata) for scorer in self._scorers]
+            para_overall = self._weighted_mean(para_results, weights, total_weight)
             preview = para[:80] + ("..." if len(para) > 80 else "")
 
             scored.append(
@@ -340,7 +366,7 @@ class Pipeline:
                     index=idx,
                     text_preview=preview,
                     overall_score=para_overall,
-                    word_count=len(words),
+                    word_count=word_count,
                     scores=para_results,
                 )
             )
@@ -357,35 +383,73 @@ class Pipeline:
         self,
         texts: list[tuple[str, str]],
         metadata: list[dict | None] | dict | None = None,
+        max_workers: int | None = None,
     ) -> list[tuple[str, QualityReport]]:
         """Score multiple texts and return labeled reports.
 
-        Uses thread-based parallelism for improved throughput.
+        Scoring is CPU-bound, so texts are spread across worker processes
+        (threads would serialize on the GIL). Falls back to scoring in this
+        process for small batches, a single CPU, or when a process pool
+        cannot be used (e.g. unpicklable custom scorers).
 
         Args:
             texts: List of (label, text) pairs.
             metadata: Per-item metadata list, a single dict applied to all, or None.
+            max_workers: Number of worker processes. Defaults to the CPU count,
+                or 1 for fewer than four texts; 1 scores everything in this process.
 
         Returns:
             List of (label, QualityReport) pairs in original order.
         """
+        return list(self.iter_score_batch(texts, metadata, max_workers))
 
-        def _score_one(i: int) -> tuple[int, str, QualityReport]:
-            label, text = texts[i]
+    def iter_score_batch(
+        self,
+        texts: list[tuple[str, str]],
+        metadata: list[dict | None] | dict | None = None,
+        max_workers: int | None = None,
+    ) -> Iterator[tuple[str, QualityReport]]:
+        """Like score_batch(), but yield each (label, report) pair as it is ready.
+
+        Pairs come back in original order, so callers can write results out
+        without holding every report in memory.
+        """
+        items = []
+        for i, (_, text) in enumerate(texts):
             if isinstance(metadata, list):
                 item_meta = metadata[i] if i < len(metadata) else None
             else:
                 item_meta = metadata
-            return (i, label, self.score(text, item_meta))
-
-        max_workers = min(len(texts), 8) if texts else 1
-        results: list[tuple[int, str, QualityReport]] = []
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            results = list(executor.map(_score_one, range(len(texts))))
-
-        # Sort by original index to preserve order
-        results.sort(key=lambda x: x[0])
-        return [(label, report) for _, label, report in results]
+            items.append((text, item_meta))
+
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) if len(items) >= _MIN_PROCESS_BATCH else 1
+        max_workers = min(max_workers, len(items))
+
+        done = 0
+        if max_workers > 1:
+            # Imported here: multiprocessing is slow to import and unused for
+            # single-text scoring.
+            import pickle
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+
+            chunksize = max(1, len(items) // (4 * max_workers))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(self,),
+                ) as executor:
+                    for report in executor.map(_score_batch_item, items, chunksize=chunksize):
+                        yield texts[done][0], report
+                        done += 1
+                return
+            except (pickle.PicklingError, AttributeError, BrokenProcessPool, OSError):
+                pass
+        # Score whatever the pool did not get to in this process
+        for (label, _), (text, item_meta) in zip(texts[done:], items[done:], strict=True):
+            yield label, self.score(text, item_meta)
 
     def compare(
         self,
@@ -452,3 +516,21 @@ class Pipeline:
             overall_delta=overall_delta,
             dimension_deltas=dimension_deltas,
         )
+
+
+# --- Process-pool workers for Pipeline.score_batch ---
+
+_batch_pipeline: Pipeline | None = None
+
+
+def _init_batch_worker(pipeline: Pipeline) -> None:
+    """Keep the pipeline sent to this worker process for all of its items."""
+    global _batch_pipeline
+    _batch_pipeline = pipeline
+
+
+def _score_batch_item(item: tuple[str, dict | None]) -> QualityReport:
+    """Score one (text, metadata) item with this worker's pipeline."""
+    text, item_meta = item
+    assert _batch_pipeline is not None
+    return _batch_pipeline.score(text, item_meta)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import ClassVar, Literal
@@ -148,16 +149,38 @@ class Scorer(ABC):
 # --- Scorer Registry ---
 
 _registry: dict[str, type[Scorer]] = {}
+_builtins_loaded = False
+_builtins_lock = threading.Lock()
+_BUILTIN_PACKAGE = "distill.scorers."
+
+
+def _load_builtin_scorers() -> None:
+    """Import distill.scorers on first use so its scorers register themselves."""
+    global _builtins_loaded
+    if _builtins_loaded:
+        return
+    with _builtins_lock:
+        if not _builtins_loaded:
+            import distill.scorers  # noqa: F401
+
+            _builtins_loaded = True
 
 
 def register(cls: type[Scorer]) -> type[Scorer]:
-    """Decorator to register a scorer class."""
+    """Decorator to register a scorer class.
+
+    Built-in scorers load lazily, so they never replace a scorer registered
+    earlier under the same name.
+    """
+    if cls.__module__.startswith(_BUILTIN_PACKAGE) and cls.name in _registry:
+        return cls
     _registry[cls.name] = cls
     return cls
 
 
 def get_scorer(name: str) -> Scorer:
     """Instantiate a registered scorer by name."""
+    _load_builtin_scorers()
     if name not in _registry:
         available = ", ".join(sorted(_registry.keys()))
         raise KeyError(f"Unknown scorer: {name!r}. Available: {available}")
@@ -166,4 +189,5 @@ def get_scorer(name: str) -> Scorer:
 
 def list_scorers() -> dict[str, str]:
     """Return {name: description} for all registered scorers."""
+    _load_builtin_scorers()
     return {name: cls.description for name, cls in sorted(_registry.items())}
@@ -15,6 +15,7 @@ import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import Finding, MatchHighlight, Scorer, ScoreResult, register
 
 # --- Pattern definitions ---
@@ -131,13 +132,18 @@ def _compile(patterns: list[str]) -> list[re.Pattern]:
 
 _claim_re = _compile(CLAIM_PATTERNS)
 _evidence_re = _compile(EVIDENCE_PATTERNS)
-_quant_evidence_re = _compile(QUANTITATIVE_EVIDENCE_PATTERNS)
 _counter_re = _compile(COUNTERARGUMENT_PATTERNS)
 _unsupported_re = _compile(UNSUPPORTED_PATTERNS)
 
 
-def _count(patterns: list[re.Pattern], text: str) -> int:
-    return sum(len(p.findall(text)) for p in patterns)
+def _compile_union(patterns: list[str]) -> re.Pattern:
+    """Join *patterns* into one alternation. Existence checks only, never counts."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Single-pass matchers for the per-sentence flow analysis
+_claim_any = _compile_union(CLAIM_PATTERNS)
+_evidence_any = _compile_union(EVIDENCE_PATTERNS + QUANTITATIVE_EVIDENCE_PATTERNS)
 
 
 def _find_matches(patterns: list[re.Pattern], text: str, category: str) -> list[MatchHighlight]:
@@ -169,9 +175,6 @@ def _count_bare_prescriptives(text: str) -> int:
     return len(_find_bare_prescriptives(text))
 
 
-_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
-
-
 def _structurally_supported_claim_ratio(text: str) -> tuple[int, int]:
     """Count claims whose evidence appears in the same or next sentence.
 
@@ -180,12 +183,9 @@ def _structurally_supported_claim_ratio(text: str) -> tuple[int, int]:
     sentence or the immediately following one — the local proximity that
     shuffled/scrambled arguments lose.
     """
-    sentences = _SENTENCE_SPLIT_RE.split(text)
-    has_claim = [any(p.search(s) for p in _claim_re) for s in sentences]
-    has_evidence = [
-        any(p.search(s) for p in _evidence_re) or any(p.search(s) for p in _quant_evidence_re)
-        for s in sentences
-    ]
+    sentences = text_features(text).sentences
+    has_claim = [_claim_any.search(s) is not None for s in sentences]
+    has_evidence = [_evidence_any.search(s) is not None for s in sentences]
 
     total = 0
     supported = 0
@@ -207,7 +207,7 @@ class ArgumentScorer(Scorer):
     weight: ClassVar[float] = 1.0
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        word_count = len(text.split())
+        word_count = text_features(text).word_count
 
         if word_count < 30:
             return ScoreResult(
@@ -217,10 +217,15 @@ class ArgumentScorer(Scorer):
                 details={"word_count": word_count},
             )
 
-        claim_count = _count(_claim_re, text)
-        evidence_count = _count(_evidence_re, text)
-        counter_count = _count(_counter_re, text)
-        unsupported_count = _count(_unsupported_re, text)
+        # One scan per category yields both the highlights and the counts
+        claim_matches = _find_matches(_claim_re, text, "claim")
+        evidence_matches = _find_matches(_evidence_re, text, "evidence")
+        counter_matches = _find_matches(_counter_re, text, "counterargument")
+        unsupported_matches = _find_matches(_unsupported_re, text, "unsupported")
+        claim_count = len(claim_matches)
+        evidence_count = len(evidence_matches)
+        counter_count = len(counter_matches)
+        unsupported_count = len(unsupported_matches)
         bare_prescriptive_count = _count_bare_prescriptives(text)
 
         # Total unsupported = explicit unsupported + bare prescriptives
@@ -276,12 +281,7 @@ class ArgumentScorer(Scorer):
         score = max(0.0, min(1.0, score))
 
         # Collect highlights
-        highlights = (
-            _find_matches(_claim_re, text, "claim")
-            + _find_matches(_evidence_re, text, "evidence")
-            + _find_matches(_counter_re, text, "counterargument")
-            + _find_matches(_unsupported_re, text, "unsupported")
-        )
+        highlights = claim_matches + evidence_matches + counter_matches + unsupported_matches
         highlights.sort(key=lambda h: h.position)
 
         signal_count = claim_count + evidence_count + counter_count + total_unsupported
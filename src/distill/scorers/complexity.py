@@ -16,6 +16,7 @@ import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import Finding, MatchHighlight, Scorer, ScoreResult, register
 
 # --- Pattern definitions ---
@@ -199,7 +200,7 @@ class ComplexityScorer(Scorer):
     weight: ClassVar[float] = 0.3
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        words = text.split()
+        words = text_features(text).words
         word_count = len(words)
 
         if word_count < 30:
@@ -210,12 +211,22 @@ class ComplexityScorer(Scorer):
                 details={"word_count": word_count},
             )
 
-        # Count all signal categories
-        jargon_count = _count(_jargon_re, text) + len(ACRONYM_RE.findall(text))
-        concept_count = _count(_concept_re, text)
-        data_density_count = _count(_data_density_re, text)
-        oversimplify_count = _count(_oversimplification_re, text)
-        needless_count = _count(_needless_re, text)
+        # Count all signal categories — one scan per category yields both the
+        # highlights and the counts
+        jargon_matches = _find_matches(_jargon_re, text, "jargon")
+        acronym_matches = [
+            MatchHighlight(text=m.group(), category="jargon", position=m.start())
+            for m in ACRONYM_RE.finditer(text)
+        ]
+        concept_matches = _find_matches(_concept_re, text, "concept_intro")
+        oversimplify_matches = _find_matches(_oversimplification_re, text, "oversimplification")
+        needless_matches = _find_matches(_needless_re, text, "needless_complexity")
+        data_density_matches = _find_matches(_data_density_re, text, "data_density")
+        jargon_count = len(jargon_matches) + len(acronym_matches)
+        concept_count = len(concept_matches)
+        data_density_count = len(data_density_matches)
+        oversimplify_count = len(oversimplify_matches)
+        needless_count = len(needless_matches)
 
         # Rates per 100 words
         scale = 100 / word_count
@@ -307,17 +318,13 @@ class ComplexityScorer(Scorer):
         complexity_level = _classify_complexity(poly_rate, jargon_rate, concept_rate)
 
         # Collect highlights
-        acronym_highlights = [
-            MatchHighlight(text=m.group(), category="jargon", position=m.start())
-            for m in ACRONYM_RE.finditer(text)
-        ]
         highlights = (
-            _find_matches(_jargon_re, text, "jargon")
-            + acronym_highlights
-            + _find_matches(_concept_re, text, "concept_intro")
-            + _find_matches(_oversimplification_re, text, "oversimplification")
-            + _find_matches(_needless_re, text, "needless_complexity")
-            + _find_matches(_data_density_re, text, "data_density")
+            jargon_matches
+            + acronym_matches
+            + concept_matches
+            + oversimplify_matches
+            + needless_matches
+            + data_density_matches
         )
         highlights.sort(key=lambda h: h.position)
 
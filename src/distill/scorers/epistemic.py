@@ -16,6 +16,7 @@ import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import Finding, MatchHighlight, Scorer, ScoreResult, register
 
 # Specific hedges — acknowledging concrete limitations (GOOD)
@@ -163,7 +164,7 @@ class EpistemicScorer(Scorer):
     weight: ClassVar[float] = 1.0
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        word_count = len(text.split())
+        word_count = text_features(text).word_count
 
         if word_count < 30:
             return ScoreResult(
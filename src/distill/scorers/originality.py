@@ -11,10 +11,12 @@ ML mode requires: pip install distill-score[ml]
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import MatchHighlight, Scorer, ScoreResult, register
 
 # --- Check for ML dependencies ---
@@ -101,10 +103,6 @@ _common_knowledge_re = _compile(COMMON_KNOWLEDGE)
 _attribution_re = _compile(ATTRIBUTION_MARKERS)
 
 
-def _count(patterns: list[re.Pattern], text: str) -> int:
-    return sum(len(p.findall(text)) for p in patterns)
-
-
 def _find_matches(patterns: list[re.Pattern], text: str, category: str) -> list[MatchHighlight]:
     matches = []
     for p in patterns:
@@ -113,9 +111,12 @@ def _find_matches(patterns: list[re.Pattern], text: str, category: str) -> list[
     return matches
 
 
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+
 def _split_paragraphs(text: str, min_words: int = 15) -> list[str]:
     """Split text into paragraphs with at least min_words words."""
-    paragraphs = re.split(r"\n\s*\n", text.strip())
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(text.strip())
     return [p.strip() for p in paragraphs if len(p.strip().split()) >= min_words]
 
 
@@ -156,7 +157,8 @@ def _vocabulary_richness(text: str) -> float | None:
     where N is the content-word count. A ratio of 1.0 is "typical";
     >1.5 is notably rich, <0.8 is notably thin.
     """
-    words = [w for w in _VOCAB_WORD_RE.findall(text.lower()) if w not in _FUNCTION_WORDS]
+    vocab = _VOCAB_WORD_RE.findall(text_features(text).lower)
+    words = [w for w in vocab if w not in _FUNCTION_WORDS]
     n = len(words)
     # Heap's Law corrections are unreliable on short text. The 200-content-word
     # threshold keeps calibration-corpus entries (~150 words total) falling
@@ -202,6 +204,18 @@ def _diversity_to_score(diversity: float) -> float:
         return min(1.0, 0.7 + diversity * 0.6)
 
 
+@functools.cache
+def _load_model():
+    """Load the sentence transformer once per process.
+
+    Every Pipeline instantiates its own scorers, so keeping the model on the
+    instance would reload it for each new pipeline.
+    """
+    from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
+
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+
 @register
 class OriginalityScorer(Scorer):
     """Measures content originality — novel ideas vs rephrased common knowledge."""
@@ -210,19 +224,12 @@ class OriginalityScorer(Scorer):
     description: ClassVar[str] = "Originality: novel claims and diverse ideas vs common knowledge"
     weight: ClassVar[float] = 0.5
 
-    def __init__(self) -> None:
-        self._model = None
-
     def _get_model(self):
-        """Lazy-load the sentence transformer model."""
-        if self._model is None and _HAS_ML:
-            from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
-
-            self._model = SentenceTransformer("all-MiniLM-L6-v2")
-        return self._model
+        """Lazy-load the sentence transformer model (shared by all instances)."""
+        return _load_model() if _HAS_ML else None
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        word_count = len(text.split())
+        word_count = text_features(text).word_count
 
         if word_count < 50:
             return ScoreResult(
@@ -237,10 +244,15 @@ class OriginalityScorer(Scorer):
         vocab_score = _vocab_richness_to_score(heaps_ratio)
 
         # --- Claim density ---
-        experience_count = _count(_experience_re, text)
-        novel_count = _count(_novel_re, text)
-        common_count = _count(_common_knowledge_re, text)
-        attribution_count = _count(_attribution_re, text)
+        # One scan per category yields both the highlights and the counts
+        experience_matches = _find_matches(_experience_re, text, "novel_claim")
+        novel_matches = _find_matches(_novel_re, text, "novel_claim")
+        common_matches = _find_matches(_common_knowledge_re, text, "common_knowledge")
+        attribution_matches = _find_matches(_attribution_re, text, "attribution")
+        experience_count = len(experience_matches)
+        novel_count = len(novel_matches)
+        common_count = len(common_matches)
+        attribution_count = len(attribution_matches)
 
         scale = 100 / word_count
         experience_rate = experience_count * scale
@@ -256,8 +268,7 @@ class OriginalityScorer(Scorer):
 
         # --- Attribution balance ---
         # Count total sentences for ratio
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        sentences = [s for s in sentences if len(s.strip()) > 10]
+        sentences = [s for s in text_features(text).sentences if len(s.strip()) > 10]
         sentence_count = max(1, len(sentences))
 
         attribution_ratio = attribution_count / sentence_count
@@ -331,12 +342,7 @@ class OriginalityScorer(Scorer):
         final_score = max(0.0, min(1.0, final_score))
 
         # --- Highlights ---
-        highlights = (
-            _find_matches(_experience_re, text, "novel_claim")
-            + _find_matches(_novel_re, text, "novel_claim")
-            + _find_matches(_common_knowledge_re, text, "common_knowledge")
-            + _find_matches(_attribution_re, text, "attribution")
-        )
+        highlights = experience_matches + novel_matches + common_matches + attribution_matches
 
         # Add repeated_idea highlights for similar paragraphs
         for i, j, sim in repeated_pairs:
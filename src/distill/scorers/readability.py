@@ -27,6 +27,7 @@ import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import Scorer, ScoreResult, register
 
 
@@ -81,6 +82,7 @@ _SUBORD_RE = re.compile(
 )
 _BULLET_LINE_RE = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s")
 _PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_WORD_RE = re.compile(r"\b[a-zA-Z]+\b")
 
 
 def _parenthetical_density(text: str, word_count: int) -> float:
@@ -128,8 +130,8 @@ class ReadabilityScorer(Scorer):
     IDEAL_GRADE_MAX = 14.0
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        words = re.findall(r"\b[a-zA-Z]+\b", text)
-        sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", text) if len(s.strip()) > 5]
+        words = _WORD_RE.findall(text)
+        sentences = [s.strip() for s in text_features(text).sentences if len(s.strip()) > 5]
 
         word_count = len(words)
         if word_count < 20:
@@ -19,6 +19,7 @@ from typing import ClassVar
 from urllib.parse import urlparse
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import MatchHighlight, Scorer, ScoreResult, register
 
 # --- Check for optional WHOIS dependency ---
@@ -371,7 +372,7 @@ def _score_author_signals(text: str) -> tuple[float, list[MatchHighlight]]:
 
 def _score_citation_density(text: str) -> tuple[float, list[MatchHighlight]]:
     """Score citation and reference density in the text."""
-    word_count = max(1, len(text.split()))
+    word_count = max(1, text_features(text).word_count)
     matches = 0
     highlights: list[MatchHighlight] = []
 
@@ -401,11 +402,33 @@ def _score_citation_density(text: str) -> tuple[float, list[MatchHighlight]]:
     return max(0.0, min(1.0, score)), highlights
 
 
+# Successful WHOIS lookups, cached per process: WHOIS is a network round-trip
+# and every Pipeline builds its own scorer instances. Failures are not cached,
+# so a transient error doesn't hide a domain's age for the rest of the process.
+_DOMAIN_AGE_CACHE: dict[str, float] = {}
+_DOMAIN_AGE_CACHE_SIZE = 1024
+
+
 def _score_domain_age(domain: str) -> float | None:
     """Look up domain age via WHOIS. Returns score or None if unavailable."""
     if not _HAS_WHOIS or not domain:
         return None
 
+    cached = _DOMAIN_AGE_CACHE.get(domain)
+    if cached is not None:
+        return cached
+
+    score = _lookup_domain_age(domain)
+    if score is not None:
+        if len(_DOMAIN_AGE_CACHE) >= _DOMAIN_AGE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _DOMAIN_AGE_CACHE.pop(next(iter(_DOMAIN_AGE_CACHE)), None)
+        _DOMAIN_AGE_CACHE[domain] = score
+    return score
+
+
+def _lookup_domain_age(domain: str) -> float | None:
+    """Score *domain* by its WHOIS creation date; None if the lookup fails."""
     try:
         from datetime import datetime
 
@@ -443,11 +466,8 @@ class SourceAuthorityScorer(Scorer):
     description: ClassVar[str] = "Source authority: domain reputation, author signals, citations"
     weight: ClassVar[float] = 1.0
 
-    def __init__(self) -> None:
-        self._age_cache: dict[str, float | None] = {}
-
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
-        word_count = len(text.split())
+        word_count = text_features(text).word_count
 
         if word_count < 20:
             return ScoreResult(
@@ -482,11 +502,7 @@ class SourceAuthorityScorer(Scorer):
         # --- Signal E: Domain age (optional) ---
         age_score = None
         if has_url and _HAS_WHOIS and domain is not None:
-            if domain in self._age_cache:
-                age_score = self._age_cache[domain]
-            else:
-                age_score = _score_domain_age(domain)
-                self._age_cache[domain] = age_score
+            age_score = _score_domain_age(domain)
 
         # --- Composite scoring ---
         if has_url and age_score is not None:
@@ -13,6 +13,7 @@ import re
 from typing import ClassVar
 
 from distill.confidence import compute_confidence_interval
+from distill.features import text_features
 from distill.scorer import Finding, MatchHighlight, Scorer, ScoreResult, register
 
 # --- Pattern definitions ---
@@ -121,6 +122,22 @@ _specific_re = _compile_patterns(SPECIFICITY_MARKERS)
 _generic_start_re = _compile_patterns(GENERIC_STARTERS)
 
 
+def _compile_union(patterns: list[str]) -> re.Pattern:
+    """Compile a pattern list into one alternation for "does any match?" checks.
+
+    Only valid for existence tests — counts must still use the per-pattern
+    lists, since an alternation reports one match where patterns overlap.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Single-pass matchers for the per-sentence checks
+_specific_any = _compile_union(SPECIFICITY_MARKERS)
+_filler_any = _compile_union(FILLER_PHRASES)
+_generic_start_any = _compile_union(GENERIC_STARTERS)
+_LOWER_WORD_RE = re.compile(r"\b[a-z]+\b")
+
+
 def _count_matches(patterns: list[re.Pattern], text: str) -> int:
     return sum(len(p.findall(text)) for p in patterns)
 
@@ -135,7 +152,7 @@ def _find_matches(patterns: list[re.Pattern], text: str, category: str) -> list[
 
 def _sentence_split(text: str) -> list[str]:
     """Rough sentence splitting."""
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = text_features(text).sentences
     return [s.strip() for s in sentences if len(s.strip()) > 10]
 
 
@@ -146,7 +163,7 @@ def _unique_word_ratio(text: str) -> float:
     unique word count to the expected count from Heap's Law (K * N^beta)
     to get a length-independent measure.
     """
-    words = re.findall(r"\b[a-z]+\b", text.lower())
+    words = _LOWER_WORD_RE.findall(text_features(text).lower)
     if not words:
         return 0.0
     n = len(words)
@@ -170,9 +187,9 @@ def _avg_sentence_info_density(sentences: list[str]) -> float:
 
     scores = []
     for sent in sentences:
-        has_specific = any(p.search(sent) for p in _specific_re)
-        has_filler = any(p.search(sent) for p in _filler_re)
-        has_generic_start = any(p.search(sent) for p in _generic_start_re)
+        has_specific = _specific_any.search(sent) is not None
+        has_filler = _filler_any.search(sent) is not None
+        has_generic_start = _generic_start_any.search(sent) is not None
 
         # Simple per-sentence score
         s = 0.5
@@ -197,7 +214,7 @@ class SubstanceScorer(Scorer):
 
     def score(self, text: str, metadata: dict | None = None) -> ScoreResult:
         sentences = _sentence_split(text)
-        word_count = len(text.split())
+        word_count = text_features(text).word_count
 
         if word_count < 20:
             return ScoreResult(
@@ -207,10 +224,14 @@ class SubstanceScorer(Scorer):
                 details={"word_count": word_count},
             )
 
-        # Component scores
-        filler_count = _count_matches(_filler_re, text)
-        hedge_count = _count_matches(_hedge_re, text)
-        specific_count = _count_matches(_specific_re, text)
+        # Component scores — one scan per category yields both the highlights
+        # and the counts (finditer and findall see the same matches)
+        filler_matches = _find_matches(_filler_re, text, "filler")
+        hedge_matches = _find_matches(_hedge_re, text, "hedge")
+        specific_matches = _find_matches(_specific_re, text, "specificity")
+        filler_count = len(filler_matches)
+        hedge_count = len(hedge_matches)
+        specific_count = len(specific_matches)
         generic_starts = _count_matches(_generic_start_re, "\n".join(sentences))
 
         # Normalize to per-100-words rates
@@ -270,11 +291,7 @@ class SubstanceScorer(Scorer):
         score = max(0.0, min(1.0, score))
 
         # Collect highlights
-        highlights = (
-            _find_matches(_filler_re, text, "filler")
-            + _find_matches(_hedge_re, text, "hedge")
-            + _find_matches(_specific_re, text, "specificity")
-        )
+        highlights = filler_matches + hedge_matches + specific_matches
         highlights.sort(key=lambda h: h.position)
 
         signal_count = filler_count + hedge_count + specific_count + generic_starts
@@ -6,7 +6,7 @@ import time
 
 import pytest
 
-from distill.cache import ScoreCache
+from distill.cache import ScoreCache, hash_text
 
 
 @pytest.fixture()
@@ -148,3 +148,166 @@ def test_rescoring_updates_entry(cache):
     # Should still be just 1 entry, not 2
     entries = cache.history()
     assert len(entries) == 1
+
+
+def test_put_many_single_transaction(cache):
+    """put_many stores every entry and each can be read back."""
+    entries = [
+        (f"Batch text {i}", {**SAMPLE_REPORT, "overall_score": 0.5 + i * 0.1}, f"{i}.txt", None)
+        for i in range(3)
+    ]
+    cache.put_many(entries, profile="default", scorer_names=["substance"])
+
+    for i in range(3):
+        result = cache.get(f"Batch text {i}", profile="default", scorer_names=["substance"])
+        assert result is not None
+        assert result["overall_score"] == pytest.approx(0.5 + i * 0.1)
+    assert cache.stats()["count"] == 3
+
+
+def test_put_many_uses_precomputed_hash(cache):
+    """put_many keys an entry by the text_hash given with it."""
+    cache.put_many([("Text A", SAMPLE_REPORT, "a.txt", None, hash_text("Text B"))])
+
+    assert cache.get("Text A") is None
+    assert cache.get("Text B") is not None
+
+
+def test_history_uses_scored_at_index(cache):
+    """history() ordering is served by the scored_at index rather than a sort."""
+    plan = cache._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM score_history ORDER BY scored_at DESC LIMIT 20"
+    ).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_score_history_scored_at" in details
+
+
+def test_precomputed_text_hash_matches(cache):
+    """Passing hash_text(text) is equivalent to letting the cache hash the text."""
+    text_hash = hash_text(SAMPLE_TEXT)
+    cache.put(SAMPLE_TEXT, SAMPLE_REPORT, text_hash=text_hash)
+
+    assert cache.get(SAMPLE_TEXT) is not None
+    assert cache.get(SAMPLE_TEXT, text_hash=text_hash)["grade"] == "B"
+
+
+def test_connection_pragmas(cache):
+    """The connection runs in WAL mode with relaxed (NORMAL) syncing."""
+    assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert cache._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_history_without_scores(cache):
+    """include_scores=False returns summary columns only."""
+    cache.put(SAMPLE_TEXT, SAMPLE_REPORT, source="test.txt")
+
+    entry = cache.history(include_scores=False)[0]
+    assert "scores" not in entry
+    assert entry["grade"] == "B"
+    assert entry["source"] == "test.txt"
+
+
+def test_legacy_full_digest_keys_migrated(tmp_path):
+    """Entries keyed by the old 64-char SHA-256 digest still hit after upgrade."""
+    import hashlib
+    import sqlite3
+
+    db_path = tmp_path / "legacy.db"
+    c = ScoreCache(db_path=db_path)
+    c.put(SAMPLE_TEXT, SAMPLE_REPORT)
+    c.close()
+
+    # Simulate a database written before keys were truncated
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "UPDATE score_history SET text_hash = ?",
+        (hashlib.sha256(SAMPLE_TEXT.encode("utf-8")).hexdigest(),),
+    )
+    conn.execute("PRAGMA user_version=0")
+    conn.commit()
+    conn.close()
+
+    c = ScoreCache(db_path=db_path)
+    try:
+        assert len(hash_text(SAMPLE_TEXT)) == 32
+        assert c.get(SAMPLE_TEXT)["grade"] == "B"
+        assert c.stats()["count"] == 1
+    finally:
+        c.close()
+
+
+def test_shared_across_threads(cache):
+    """One instance can be used from worker threads; each gets its own connection."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache.put(SAMPLE_TEXT, SAMPLE_REPORT)
+
+    def _lookup(i: int) -> str:
+        cache.put(f"worker text {i}", SAMPLE_REPORT)
+        return cache.get(SAMPLE_TEXT)["grade"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        grades = list(executor.map(_lookup, range(8)))
+
+    assert grades == ["B"] * 8
+    assert cache.stats()["count"] == 9
+    assert len(cache._conns) > 1
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_roundtrip_with_and_without_orjson(cache, monkeypatch, use_orjson):
+    """Reports round-trip identically whichever JSON encoder is available."""
+    import distill.cache as cache_module
+
+    if use_orjson and not cache_module._HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(cache_module, "_HAS_ORJSON", use_orjson)
+
+    report = {**SAMPLE_REPORT, "details": {1: "int key", "ratio": 0.1 + 0.2}}
+    cache.put(SAMPLE_TEXT, report, metadata={"title": "Café"})
+
+    result = cache.get(SAMPLE_TEXT)
+    assert result["details"] == {"1": "int key", "ratio": 0.1 + 0.2}
+    assert result["dimensions"] == SAMPLE_REPORT["dimensions"]
+
+
+def test_hot_cache_serves_repeat_lookups(cache):
+    """A repeat get() is answered from memory without touching SQLite."""
+    cache.put(SAMPLE_TEXT, SAMPLE_REPORT)
+    first = cache.get(SAMPLE_TEXT)
+
+    cache._conn.execute("DELETE FROM score_history")  # bypasses clear()
+    assert cache.get(SAMPLE_TEXT) is first
+
+
+def test_hot_cache_bounded_and_cleared(cache, monkeypatch):
+    """The in-memory tier evicts least-recently-used entries and empties on clear()."""
+    import distill.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_HOT_CACHE_SIZE", 2)
+    for i in range(3):
+        cache.put(f"text {i}", SAMPLE_REPORT)
+        cache.get(f"text {i}")
+    assert len(cache._hot) == 2
+
+    # A write replaces the stored row, so its in-memory copy is dropped
+    cache.put("text 2", {**SAMPLE_REPORT, "grade": "C"})
+    assert cache.get("text 2")["grade"] == "C"
+
+    cache.clear()
+    assert len(cache._hot) == 0
+    assert cache.get("text 2") is None
+
+
+def test_get_cache_shared_per_default_path(tmp_path, monkeypatch):
+    """get_cache() reuses one instance until the default database path changes."""
+    import distill.cache as cache_module
+
+    monkeypatch.setattr(cache_module, "_DEFAULT_DB_PATH", tmp_path / "a.db")
+    first = cache_module.get_cache()
+    assert cache_module.get_cache() is first
+
+    monkeypatch.setattr(cache_module, "_DEFAULT_DB_PATH", tmp_path / "b.db")
+    second = cache_module.get_cache()
+    assert second is not first
+    assert second._db_path == tmp_path / "b.db"
@@ -69,6 +69,64 @@ class TestScoreCommand:
         result = runner.invoke(main, ["score", sample_file, "--paragraphs"])
         assert result.exit_code == 0
 
+    def test_paragraphs_and_highlights_print_brackets_literally(self, tmp_path):
+        paragraph = SAMPLE_TEXT.replace("\n", " ") + "See [/ref] and [note] for details."
+        p = tmp_path / "brackets.txt"
+        p.write_text(f"{paragraph}\n\n{paragraph}")
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["score", str(p), "--paragraphs", "--highlights", "--no-cache"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "[intro]" in result.output
+        assert "[specificity    ]" in result.output
+
+    def test_paragraph_previews_flatten_whitespace(self, tmp_path):
+        paragraph = SAMPLE_TEXT.replace("We migrated", "We\tmigrated")
+        p = tmp_path / "tabs.txt"
+        p.write_text(f"{paragraph}\n{paragraph}")
+        runner = CliRunner()
+        result = runner.invoke(main, ["score", str(p), "--paragraphs", "--no-cache"])
+        assert result.exit_code == 0, result.output
+        assert '"We migrated our PostgreSQL' in result.output
+
+    def test_score_url_json_has_no_progress_output(self, monkeypatch):
+        import distill.extractors
+
+        def fake_extract(url, timeout=15.0, client=None):
+            return {"title": url, "text": SAMPLE_TEXT, "url": url}
+
+        monkeypatch.setattr(distill.extractors, "extract_from_url", fake_extract)
+        runner = CliRunner()
+        url = "https://example.com/post"
+        result = runner.invoke(main, ["score", url, "--json", "--no-cache"])
+        assert result.exit_code == 0
+        assert "overall_score" in json.loads(result.output)
+
+        result = runner.invoke(main, ["compare", url, f"{url}?b", "--json"])
+        assert result.exit_code == 0
+        assert "winner" in json.loads(result.output)
+
+    def test_score_stdin_invalid_utf8(self):
+        runner = CliRunner()
+        data = SAMPLE_TEXT.encode("utf-8") + b"\xff\xfe stray bytes."
+        result = runner.invoke(main, ["score", "-", "--json", "--no-cache"], input=data)
+        assert result.exit_code == 0
+        assert "overall_score" in json.loads(result.output)
+
+    def test_stdin_after_partial_read(self, monkeypatch):
+        import io
+        import sys
+
+        from distill.cli import _resolve_source
+
+        stdin = io.TextIOWrapper(io.BytesIO(SAMPLE_TEXT.encode("utf-8")), encoding="utf-8")
+        first_line = stdin.readline()
+        monkeypatch.setattr(sys, "stdin", stdin)
+        label, text, _ = _resolve_source("-")
+        assert label == "stdin"
+        assert first_line + text == SAMPLE_TEXT
+
     def test_score_missing_file(self):
         runner = CliRunner()
         result = runner.invoke(main, ["score", "/nonexistent/file.txt"])
@@ -110,6 +168,116 @@ class TestGateCommand:
         assert "results" in data
 
 
+class TestBatchCommand:
+    def test_batch_urls_share_client_and_keep_order(self, monkeypatch):
+        import distill.extractors
+
+        clients = []
+
+        def fake_extract(url, timeout=15.0, client=None):
+            clients.append(client)
+            return {"title": url, "text": SAMPLE_TEXT + url, "url": url}
+
+        monkeypatch.setattr(distill.extractors, "extract_from_url", fake_extract)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        runner = CliRunner()
+        result = runner.invoke(main, ["batch", *urls, "--jsonl", "--no-cache"])
+        assert result.exit_code == 0
+        sources = [json.loads(line)["source"] for line in result.output.splitlines()]
+        assert sorted(sources) == sorted(urls)
+        assert len(clients) == 5
+        assert clients[0] is not None
+        assert all(c is clients[0] for c in clients)
+
+    @pytest.mark.parametrize("have_h2", [True, False])
+    def test_batch_url_client_uses_http2_when_available(self, monkeypatch, have_h2):
+        import importlib.util
+
+        import httpx
+
+        import distill.extractors
+
+        real_find_spec = importlib.util.find_spec
+
+        def find_spec(name, *args):
+            if name == "h2":
+                return object() if have_h2 else None
+            return real_find_spec(name, *args)
+
+        monkeypatch.setattr(importlib.util, "find_spec", find_spec)
+        seen = []
+
+        class RecordingClient(httpx.Client):
+            def __init__(self, **kwargs):
+                seen.append(kwargs.pop("http2"))
+                super().__init__(**kwargs)
+
+        monkeypatch.setattr(httpx, "Client", RecordingClient)
+        monkeypatch.setattr(
+            distill.extractors,
+            "extract_from_url",
+            lambda url, timeout=15.0, client=None: {"title": url, "text": SAMPLE_TEXT, "url": url},
+        )
+        runner = CliRunner()
+        result = runner.invoke(main, ["batch", "https://example.com/a", "--jsonl", "--no-cache"])
+        assert result.exit_code == 0
+        assert seen == [have_h2]
+
+    def test_batch_mixed_files_and_urls_keep_order(self, sample_file, short_file, monkeypatch):
+        import distill.extractors
+
+        def fake_extract(url, timeout=15.0, client=None):
+            return {"title": url, "text": SAMPLE_TEXT + url, "url": url}
+
+        monkeypatch.setattr(distill.extractors, "extract_from_url", fake_extract)
+        sources = ["https://a.example/1", sample_file, "https://b.example/2", short_file]
+        runner = CliRunner()
+        result = runner.invoke(main, ["batch", *sources, "--jsonl", "--no-cache"])
+        assert result.exit_code == 0
+        assert [json.loads(line)["source"] for line in result.output.splitlines()] == sources
+
+    def test_batch_stdin_twice(self):
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["batch", "-", "-", "--jsonl", "--no-cache"], input=SAMPLE_TEXT.encode()
+        )
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line)["source"] for line in result.output.splitlines()] == ["-", "-"]
+
+    def test_large_ranked_summary_is_plain_text(self, sample_file, short_file, monkeypatch):
+        import distill.cli
+
+        monkeypatch.setattr(distill.cli, "_MAX_STYLED_ROWS", 1)
+        runner = CliRunner()
+        result = runner.invoke(main, ["batch", sample_file, short_file, "--no-cache"])
+        assert result.exit_code == 0
+        summary = result.output[result.output.index("Ranked Summary") :].splitlines()
+        assert summary[1].split()[:4] == ["Rank", "Source", "Overall", "Grade"]
+        assert set(summary[2]) == {"-"}
+        assert summary[3].split()[0] == "1"
+        assert len(summary) == 5
+
+
+class TestPlainTable:
+    def test_columns_aligned(self):
+        from distill.cli import _plain_table
+
+        out = _plain_table("T", ["A", "Name"], [["1", "x"], ["10", "long"]], ["right", "left"])
+        assert out.splitlines() == ["   T", " A  Name", "--------", " 1  x", "10  long"]
+
+
+def test_without_highlights_matches_plain_to_dict():
+    from distill.cli import _without_highlights
+    from distill.pipeline import Pipeline
+
+    report = Pipeline().score(SAMPLE_TEXT + " In today's fast-paced world, let's dive in.")
+    full = report.to_dict(include_highlights=True)
+    assert any("highlights" in d for d in full["dimensions"].values())
+    assert _without_highlights(full) == report.to_dict()
+    assert list(_without_highlights(full, source="x")) == ["source", *report.to_dict()]
+    assert any("highlights" in d for d in full["dimensions"].values())
+
+
 class TestListCommand:
     def test_list_scorers(self):
         runner = CliRunner()
@@ -121,3 +289,45 @@ class TestListCommand:
         runner = CliRunner()
         result = runner.invoke(main, ["profiles"])
         assert result.exit_code == 0
+
+
+def test_cli_import_defers_rich_and_scorers():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, distill.cli; "
+        "print(any(m in sys.modules for m in "
+        "('rich', 'distill.scorers', 'distill.pipeline', 'distill.content_type', "
+        "'multiprocessing')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert out.strip() == "False"
+
+
+def test_score_bar_returns_independent_copies():
+    from distill.cli import _score_bar
+
+    first = _score_bar(0.72)
+    first.append(" [0.60-0.80]")
+    second = _score_bar(0.72)
+    assert second.plain == "##############...... 0.72"
+    assert second is not first
+
+
+@pytest.mark.parametrize("have_orjson", [True, False])
+def test_json_output_with_and_without_orjson(sample_file, monkeypatch, have_orjson):
+    import sys
+
+    if have_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    runner = CliRunner()
+    result = runner.invoke(main, ["score", sample_file, "--json", "--no-cache"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert "overall_score" in data
+    assert result.output.startswith('{\n  "')
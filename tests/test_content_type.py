@@ -79,6 +79,29 @@ def test_whitespace_only():
     assert result.confidence == 0.0
 
 
+def test_signals_keyed_by_original_pattern():
+    """Matching runs on lowercased text; signal keys keep the patterns' source case."""
+    result = detect_content_type(TECHNICAL_TEXT.upper())
+    assert result.name == "technical"
+    assert result.signals == detect_content_type(TECHNICAL_TEXT).signals
+    assert r"\b(?:API|SDK|CLI|ORM|SQL|HTTP|TCP|UDP|DN" in result.signals
+
+
+def test_capped_density_skips_later_categories(monkeypatch):
+    """A category at full density can't be overtaken, so later ones aren't scanned."""
+    import distill.content_type as ct
+
+    class Unreachable:
+        def findall(self, text):
+            raise AssertionError("scanned after a capped category")
+
+    monkeypatch.setattr(ct, "_NEWS_PATTERNS", [("unreachable", Unreachable())])
+    monkeypatch.setattr(ct, "_OPINION_PATTERNS", [("unreachable", Unreachable())])
+    result = detect_content_type(TECHNICAL_TEXT)
+    assert result.name == "technical"
+    assert result.confidence == 1.0
+
+
 def test_content_type_dataclass():
     ct = ContentType(name="technical", confidence=0.5, signals={"code": 3})
     assert ct.name == "technical"
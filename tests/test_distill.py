@@ -349,6 +349,47 @@ class TestBatch:
         assert results[2][0] == "moderate"
         assert results[3][0] == "expert2"
 
+    def test_batch_process_pool_matches_in_process(self):
+        pipeline = Pipeline()
+        texts = [("expert", EXPERT_CONTENT), ("slop", AI_SLOP), ("moderate", MODERATE_CONTENT)]
+        pooled = pipeline.score_batch(texts, max_workers=2)
+        serial = pipeline.score_batch(texts, max_workers=1)
+
+        assert [label for label, _ in pooled] == ["expert", "slop", "moderate"]
+        for (_, a), (_, b) in zip(pooled, serial, strict=True):
+            assert a.overall_score == b.overall_score
+
+    def test_iter_score_batch_yields_in_order(self):
+        pipeline = Pipeline()
+        texts = [("expert", EXPERT_CONTENT), ("slop", AI_SLOP), ("moderate", MODERATE_CONTENT)]
+        it = pipeline.iter_score_batch(texts, max_workers=1)
+        label, report = next(it)
+        assert label == "expert"
+        assert report.overall_score == pipeline.score(EXPERT_CONTENT).overall_score
+        assert [label for label, _ in it] == ["slop", "moderate"]
+
+    def test_small_batch_scored_in_process(self, monkeypatch):
+        import concurrent.futures
+
+        monkeypatch.setattr("os.cpu_count", lambda: 4)
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small batch")
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+        texts = [("expert", EXPERT_CONTENT), ("slop", AI_SLOP)]
+        results = Pipeline().score_batch(texts)
+        assert [label for label, _ in results] == ["expert", "slop"]
+
+    def test_auto_profile_does_not_leak_between_texts(self):
+        pipeline = Pipeline(auto_profile=True)
+        pipeline.score(EXPERT_CONTENT)
+        first_weights = pipeline._scorer_weights()
+        pipeline.score(AI_SLOP)
+        pipeline.score(EXPERT_CONTENT)
+
+        assert pipeline._scorer_weights() == first_weights
+
 
 class TestProfiles:
     def test_profile_applies_weights(self):
@@ -495,6 +536,28 @@ class TestConvenienceFunctions:
         finally:
             os.unlink(path)
 
+    def test_score_file_invalid_utf8(self):
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as f:
+            f.write(EXPERT_CONTENT.encode("utf-8") + b"\xff\xfe trailing bytes.")
+            path = f.name
+        try:
+            report = distill.score_file(path)
+            assert report.overall_score > 0.0
+        finally:
+            os.unlink(path)
+
+    def test_pipeline_reused_across_calls(self):
+        first = distill._get_pipeline(["substance"], {"substance": 2.0}, "technical", False)
+        second = distill._get_pipeline(["substance"], {"substance": 2.0}, "technical", False)
+        assert first is second
+        other = distill._get_pipeline(["substance"], None, "technical", False)
+        assert other is not first
+
+    def test_auto_profile_pipeline_not_shared(self):
+        first = distill._get_pipeline(None, None, None, True)
+        second = distill._get_pipeline(None, None, None, True)
+        assert first is not second
+
 
 class TestToDict:
     def test_match_highlight_to_dict(self):
@@ -572,8 +635,94 @@ class TestExtractorExports:
         assert "text" in result
         assert "Hello world" in result["text"]
 
+    def test_extract_from_html_decodes_entities_once(self):
+        from distill import extract_from_html
+
+        html = (
+            "<html><body><p>Write &amp;lt;p&amp;gt; to get &lt;p&gt; &amp; more.</p></body></html>"
+        )
+        text = extract_from_html(html)["text"]
+        assert text == "Write &lt;p&gt; to get <p> & more."
+
     def test_extract_from_url_exported(self):
         # Just verify the function is importable from top level
         from distill import extract_from_url
 
         assert callable(extract_from_url)
+
+    @pytest.mark.parametrize(("retry_after", "expected_calls"), [("0", 2), ("3600", 1), (None, 1)])
+    def test_extract_from_url_retries_short_429(self, monkeypatch, retry_after, expected_calls):
+        import httpx
+
+        from distill.extractors import extract_from_url
+
+        monkeypatch.setattr("distill.extractors.time.sleep", lambda s: None)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                headers = {"Retry-After": retry_after} if retry_after is not None else {}
+                return httpx.Response(429, headers=headers)
+            return httpx.Response(200, html="<html><body><p>Hello world</p></body></html>")
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            if expected_calls == 2:
+                result = extract_from_url("https://example.com/", client=client)
+                assert "Hello world" in result["text"]
+            else:
+                with pytest.raises(httpx.HTTPStatusError):
+                    extract_from_url("https://example.com/", client=client)
+        assert len(calls) == expected_calls
+
+
+class TestLazyImports:
+    def test_import_does_not_load_heavy_modules(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, distill; "
+            "print(any(m in sys.modules for m in ('httpx', 'distill.scorers', 'sqlite3')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "False"
+
+    def test_user_scorer_registered_before_first_lookup_survives(self):
+        import subprocess
+        import sys
+
+        code = (
+            "from distill.scorer import Scorer, ScoreResult, get_scorer, list_scorers, register\n"
+            "@register\n"
+            "class Custom(Scorer):\n"
+            "    name = 'substance'\n"
+            "    description = 'custom'\n"
+            "    def score(self, text, metadata=None):\n"
+            "        return ScoreResult(name=self.name, score=1.0)\n"
+            "print(type(get_scorer('substance')).__name__, 'epistemic' in list_scorers())\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.split() == ["Custom", "True"]
+
+    def test_lazy_exports_resolve(self):
+        from distill.content_type import detect_content_type
+        from distill.pipeline import Pipeline, QualityReport
+
+        assert distill.Pipeline is Pipeline
+        assert distill.QualityReport is QualityReport
+        assert distill.detect_content_type is detect_content_type
+
+    def test_score_cache_exported(self):
+        from distill import ScoreCache
+        from distill.cache import ScoreCache as CacheScoreCache
+
+        assert ScoreCache is CacheScoreCache
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            distill.not_a_real_name  # noqa: B018
@@ -6,10 +6,19 @@ import csv
 import io
 import json
 
+import pytest
 from click.testing import CliRunner
 
+import distill.export
 from distill.cli import main
-from distill.export import report_to_csv_row, report_to_jsonl_line, reports_to_csv
+from distill.export import (
+    dict_to_csv_row,
+    dict_to_jsonl_bytes,
+    dict_to_jsonl_line,
+    report_to_csv_row,
+    report_to_jsonl_line,
+    reports_to_csv,
+)
 from distill.pipeline import Pipeline
 
 SAMPLE_TEXT = """
@@ -152,6 +161,30 @@ class TestCsvCli:
         rows = list(reader)
         assert len(rows) == 2
 
+    def test_dict_row_matches_report_row(self):
+        report = Pipeline().score(SAMPLE_TEXT)
+        expected = report_to_csv_row(report, source="a.txt")
+        assert dict_to_csv_row(report.to_dict(include_highlights=True), source="a.txt") == expected
+
+    def test_batch_csv_mixes_cached_and_fresh(self, tmp_path, monkeypatch):
+        import distill.cache
+
+        monkeypatch.setattr(distill.cache, "_DEFAULT_DB_PATH", tmp_path / "history.db")
+        f1 = tmp_path / "a.txt"
+        f2 = tmp_path / "b.txt"
+        f1.write_text(SAMPLE_TEXT)
+        f2.write_text(SAMPLE_TEXT + "\nA second paragraph with 3 more details.")
+
+        runner = CliRunner()
+        assert runner.invoke(main, ["batch", "--csv", str(f1)]).exit_code == 0
+        result = runner.invoke(main, ["batch", "--csv", str(f2), str(f1)])
+
+        assert result.exit_code == 0, result.output
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert [r["source"] for r in rows] == [str(f2), str(f1)]
+        assert "dimensions" not in rows[0]
+        assert rows[1]["substance_score"]
+
     def test_batch_csv_json_mutually_exclusive(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text(SAMPLE_TEXT)
@@ -188,6 +221,26 @@ class TestJsonlExport:
         parsed = json.loads(line)
         assert "dimensions" in parsed
 
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_dict_line_matches_report_line(self, monkeypatch, have_orjson):
+        if have_orjson and not distill.export._HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(distill.export, "_HAS_ORJSON", have_orjson)
+        report = Pipeline().score(SAMPLE_TEXT)
+        line = dict_to_jsonl_line(report.to_dict(), source="a.txt")
+        assert line == report_to_jsonl_line(report, source="a.txt")
+        assert next(iter(json.loads(line))) == "source"
+        assert " " not in line.split('"label"')[0]
+
+    @pytest.mark.parametrize("have_orjson", [True, False])
+    def test_dict_bytes_match_dict_line(self, monkeypatch, have_orjson):
+        if have_orjson and not distill.export._HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(distill.export, "_HAS_ORJSON", have_orjson)
+        data = {**Pipeline().score(SAMPLE_TEXT).to_dict(), "label": "caf\u00e9"}
+        line = dict_to_jsonl_bytes(data, source="a.txt")
+        assert line == (dict_to_jsonl_line(data, source="a.txt") + "\n").encode("utf-8")
+
 
 class TestJsonlCli:
     def test_batch_jsonl(self, tmp_path):
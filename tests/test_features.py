@@ -0,0 +1,51 @@
+"""Tests for shared text features."""
+
+from __future__ import annotations
+
+from distill.features import TextFeatures, shared_features, text_features
+from distill.pipeline import Pipeline
+from distill.scorer import ScoreResult
+
+
+def test_words_and_count():
+    f = TextFeatures("The quick  brown\nfox.")
+    assert f.words == ("The", "quick", "brown", "fox.")
+    assert f.word_count == 4
+
+
+def test_sentences_split_on_terminal_punctuation():
+    f = TextFeatures("First one. Second one! Third?")
+    assert f.sentences == ("First one.", "Second one!", "Third?")
+
+
+def test_lower():
+    assert TextFeatures("MiXeD Case").lower == "mixed case"
+
+
+def test_text_features_shared_only_inside_block():
+    text = "Some text that several scorers look at."
+    assert text_features(text) is not text_features(text)
+    with shared_features(text) as features:
+        assert text_features(text) is features
+        assert text_features(text + " More.") is not features
+    assert text_features(text) is not features
+
+
+def test_pipeline_shares_features_within_one_score():
+    text = "We measured p99 latency at 340ms before the change and 95ms after it. " * 5
+    seen = []
+
+    class SpyScorer:
+        name = "spy"
+        weight = 1.0
+
+        def score(self, text, metadata=None):
+            seen.append(text_features(text))
+            return ScoreResult(name=self.name, score=0.5)
+
+    pipeline = Pipeline(scorers=[])
+    pipeline._scorers = [SpyScorer(), SpyScorer()]
+    pipeline.score(text)
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert text_features(text) is not seen[0]
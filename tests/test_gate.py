@@ -34,6 +34,9 @@ your full potential as a developer.
 """
 
 
+EXPERT_REPORT_STUB = {"overall_score": 0.8, "grade": "B", "word_count": 120}
+
+
 class TestGatePass:
     def test_pass_with_default_grade(self, tmp_path):
         f = tmp_path / "good.txt"
@@ -181,3 +184,88 @@ class TestGateNoSources:
         runner = CliRunner()
         result = runner.invoke(main, ["gate"])
         assert result.exit_code == 1
+
+
+class TestGateCacheWrites:
+    def test_scores_committed_when_a_later_source_fails(self, tmp_path, monkeypatch):
+        import distill.cache
+        from distill.cache import ScoreCache
+        from distill.pipeline import Pipeline
+
+        db_path = tmp_path / "history.db"
+        monkeypatch.setattr(distill.cache, "_DEFAULT_DB_PATH", db_path)
+        good = tmp_path / "good.txt"
+        good.write_text(EXPERT_CONTENT)
+        bad = tmp_path / "bad.txt"
+        bad.write_text(AI_SLOP)
+
+        real_score = Pipeline.score
+
+        def score(self, text, *args, **kwargs):
+            if text == AI_SLOP:
+                raise RuntimeError("scorer failure")
+            return real_score(self, text, *args, **kwargs)
+
+        monkeypatch.setattr(Pipeline, "score", score)
+        runner = CliRunner()
+        result = runner.invoke(main, ["gate", str(good), str(bad), "--no-cache"])
+        assert isinstance(result.exception, RuntimeError)
+
+        other = ScoreCache(db_path)
+        try:
+            assert [e["source"] for e in other.history()] == [str(good)]
+        finally:
+            other.close()
+
+    def test_other_writers_not_blocked_while_scoring(self, tmp_path, monkeypatch):
+        import distill.cache
+        from distill.cache import ScoreCache
+        from distill.pipeline import Pipeline
+
+        db_path = tmp_path / "history.db"
+        monkeypatch.setattr(distill.cache, "_DEFAULT_DB_PATH", db_path)
+        first = tmp_path / "first.txt"
+        first.write_text(EXPERT_CONTENT)
+        second = tmp_path / "second.txt"
+        second.write_text(AI_SLOP)
+
+        real_score = Pipeline.score
+        other = ScoreCache(db_path)
+        other._conn.execute("PRAGMA busy_timeout = 0")
+
+        def score(self, text, *args, **kwargs):
+            if text == AI_SLOP:
+                # The first source is already scored; a concurrent writer
+                # must not find the database locked
+                other.put("concurrent", EXPERT_REPORT_STUB, source="other")
+            return real_score(self, text, *args, **kwargs)
+
+        monkeypatch.setattr(Pipeline, "score", score)
+        try:
+            runner = CliRunner()
+            result = runner.invoke(main, ["gate", str(first), str(second), "--no-cache"])
+            assert result.exception is None or isinstance(result.exception, SystemExit)
+            sources = {e["source"] for e in other.history()}
+            assert sources == {"other", str(first), str(second)}
+        finally:
+            other.close()
+
+
+class TestGateUrls:
+    def test_urls_share_client_and_keep_order(self, monkeypatch):
+        import distill.extractors
+
+        clients = []
+
+        def fake_extract(url, timeout=15.0, client=None):
+            clients.append(client)
+            return {"title": url, "text": EXPERT_CONTENT + url, "url": url}
+
+        monkeypatch.setattr(distill.extractors, "extract_from_url", fake_extract)
+        urls = [f"https://example.com/{i}" for i in range(4)]
+        runner = CliRunner()
+        result = runner.invoke(main, ["gate", *urls, "--json", "--min-score", "0.1", "--no-cache"])
+        assert result.exit_code == 0
+        assert [r["source"] for r in json.loads(result.output)["results"]] == urls
+        assert clients[0] is not None
+        assert all(c is clients[0] for c in clients)
@@ -137,6 +137,30 @@ class TestDomainLookup:
         assert score == 0.10
         assert match_type == "exact"
 
+    def test_domain_age_failure_not_cached(self, monkeypatch):
+        import sys
+        import types
+        from datetime import datetime
+
+        import distill.scorers.source_authority as sa
+
+        calls = []
+
+        def fake_whois(domain):
+            calls.append(domain)
+            if len(calls) == 1:
+                raise OSError("connection reset")
+            return types.SimpleNamespace(creation_date=datetime(1990, 1, 1))
+
+        monkeypatch.setitem(sys.modules, "whois", types.SimpleNamespace(whois=fake_whois))
+        monkeypatch.setattr(sa, "_HAS_WHOIS", True)
+        monkeypatch.setattr(sa, "_DOMAIN_AGE_CACHE", {})
+
+        assert sa._score_domain_age("example.org") is None
+        assert sa._score_domain_age("example.org") == 0.90
+        assert sa._score_domain_age("example.org") == 0.90
+        assert calls == ["example.org", "example.org"]
+
 
 class TestHighlights:
     """Test highlight generation."""